@@ -51,7 +51,8 @@ class BaseAgent:
         llm_client: AzureOpenAIClient, 
         tools: Dict[str, Tool], 
         system_prompt: str,
-        max_iterations: int = 10
+        max_iterations: int = 10,
+        temperature: Optional[float] = None
     ):
         """
         Initialize the base agent.
@@ -61,11 +62,13 @@ class BaseAgent:
             tools: Dictionary of available tools {name: tool_instance}
             system_prompt: System prompt for the agent's behavior
             max_iterations: Maximum iterations to prevent infinite loops
+            temperature: Sampling temperature sent with every LLM call; the model default if None
         """
         self.llm_client = llm_client
         self.tools = tools
         self.system_prompt = system_prompt
         self.max_iterations = max_iterations
+        self.temperature = temperature
         
     def _prepare_messages(self, user_input: str, context: Context) -> List[Dict[str, Any]]:
         """Prepare messages for LLM including system prompt and conversation history."""
@@ -87,10 +90,15 @@ class BaseAgent:
         """Call LLM with tools and get response."""
         tools = self._get_tools_for_llm()
         
+        kwargs = {}
+        if self.temperature is not None:
+            kwargs["temperature"] = self.temperature
+        
         response = await self.llm_client.invoke(
             messages=messages,
             tools=tools,
-            tool_choice="required"  # Force tool usage for consistency
+            tool_choice="required",  # Force tool usage for consistency
+            **kwargs
         )
         
         return response
@@ -1,7 +1,8 @@
 import os
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Optional, TypeVar
-from openai import AsyncAzureOpenAI as AzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI as AzureOpenAI, DefaultAsyncHttpxClient
 from pydantic import BaseModel
 
 # Load environment variables from the root .env file
@@ -28,6 +29,10 @@ load_dotenv(override=True, dotenv_path=os.path.join(os.path.dirname(os.path.dirn
 
 MAX_TOKENS = 16384
 
+# Keep-alive connection pool shared by every request of a client, so LLM
+# calls reuse open TLS connections instead of handshaking again
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=75)
+
 T = TypeVar('T', bound=BaseModel)
 
 class AzureOpenAIClient():
@@ -47,10 +52,21 @@ class AzureOpenAIClient():
             api_key=api_key or os.getenv("AZURE_OPENAI_API_KEY"),
             api_version=api_version or os.getenv("AZURE_OPENAI_API_VERSION"),
             azure_endpoint=azure_endpoint or os.getenv("AZURE_OPENAI_ENDPOINT"),
+            http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
         )
 
         self.deployment_name = deployment_name or os.getenv("AZURE_OPENAI_MODEL")
     
+    async def aclose(self):
+        """Close the pooled HTTP connections"""
+        await self.client.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def invoke(
         self,
         messages: List[Dict[str, str]],
@@ -1,5 +1,8 @@
 from typing import Dict, Any, Optional, Type, TypeVar, Callable, Generic, Awaitable
 from pydantic import BaseModel
+from concurrent.futures import Executor
+import asyncio
+import functools
 import inspect
 import json
 from .context_injection import needs_context_injection, get_context_fields
@@ -8,6 +11,7 @@ T = TypeVar('T', bound=BaseModel)
 C = TypeVar('C', bound=BaseModel)
 ToolResultType = TypeVar('ToolResultType')
 
+
 class ToolCall(BaseModel):
     """Represents a call to a specific tool with its arguments."""
     name: str
@@ -29,7 +33,9 @@ class Tool(Generic[ToolResultType]):
         takes_ctx: bool = True,  # Most tools need context
         result_formatter_fn: Optional[Callable[[ToolResultType], str]] = None,
         context_update_fn: Optional[Callable[[C, ToolResultType], None]] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        cpu_bound: bool = False,
+        executor: Optional[Executor] = None
     ):
         """
         Initialize a tool with its metadata and invocation function.
@@ -42,6 +48,9 @@ class Tool(Generic[ToolResultType]):
             result_formatter_fn: Optional function to format the tool result for message history
             context_update_fn: Optional callback to update context after tool execution
             description: Optional description of the tool
+            cpu_bound: Run a synchronous function in a worker thread so it does not block the event loop
+            executor: Executor for cpu_bound calls; the event loop's default executor if None.
+                The owner of the executor shuts it down.
         """
         self.name = name
         self.function = function
@@ -49,6 +58,9 @@ class Tool(Generic[ToolResultType]):
         self.takes_ctx = takes_ctx
         self.result_formatter_fn = result_formatter_fn
         self.context_update_fn = context_update_fn
+        self.cpu_bound = cpu_bound
+        self.executor = executor
+        self._openai_tool: Optional[Dict[str, Any]] = None
         
         # ✅ Check for context injection setup
         if needs_context_injection(function):
@@ -101,24 +113,15 @@ class Tool(Generic[ToolResultType]):
                         )
                 
                 # Call with auto-injected parameters
-                if inspect.iscoroutinefunction(self.function):
-                    raw_result: ToolResultType = await self.function(**function_kwargs)
-                else:
-                    raw_result: ToolResultType = self.function(**function_kwargs)
+                raw_result: ToolResultType = await self._call_function(**function_kwargs)
             
             else:
                 # ✅ Legacy: pass ctx directly (backward compatibility)
-                if inspect.iscoroutinefunction(self.function):
-                    raw_result: ToolResultType = await self.function(ctx, validated_args)
-                else:
-                    raw_result: ToolResultType = self.function(ctx, validated_args)
+                raw_result: ToolResultType = await self._call_function(ctx, validated_args)
         
         else:
             # Function doesn't need context
-            if inspect.iscoroutinefunction(self.function):
-                raw_result: ToolResultType = await self.function(validated_args)
-            else:
-                raw_result: ToolResultType = self.function(validated_args)
+            raw_result: ToolResultType = await self._call_function(validated_args)
         
         # ✅ GENERIC: Apply context update callback if provided
         if self.context_update_fn and ctx is not None:
@@ -132,6 +135,17 @@ class Tool(Generic[ToolResultType]):
         
         return formatted_result
     
+    async def _call_function(self, *args: Any, **kwargs: Any) -> ToolResultType:
+        """Call the tool function, off the event loop if it is a cpu_bound sync function"""
+        if inspect.iscoroutinefunction(self.function):
+            return await self.function(*args, **kwargs)
+        if self.cpu_bound:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(self.function, *args, **kwargs)
+            )
+        return self.function(*args, **kwargs)
+    
     def _default_format(self, result: ToolResultType) -> str:
         """
         Default formatting for tool results.
@@ -161,14 +175,20 @@ class Tool(Generic[ToolResultType]):
         """
         Convert tool to OpenAI function format for LLM tool calling.
         
+        The definition is static for the lifetime of the tool, so it is built
+        once (including the JSON schema of args_schema) and reused on every
+        LLM request.
+        
         Returns:
             Dict compatible with OpenAI's tool calling format
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.args_schema.model_json_schema()
+        if self._openai_tool is None:
+            self._openai_tool = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.args_schema.model_json_schema()
+                }
             }
-        } 
\ No newline at end of file
+        return self._openai_tool 
\ No newline at end of file
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the Spartacus test scripts
+
+Scripts import what they need from here instead of each repeating the
+sys.path setup, backend URL and health check. requests is only imported
+when an HTTP helper is first used, so scripts that just need the path
+setup do not pay for it.
+"""
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BASE_URL = "http://127.0.0.1:8000"
+
+# Backoff between health check attempts, in seconds: doubled after each
+# attempt up to the cap
+HEALTH_RETRY_DELAY = 0.2
+HEALTH_RETRY_MAX_DELAY = 3.2
+
+_session = None
+
+
+def ensure_on_path():
+    """Make the project packages importable from a script"""
+    root = str(PROJECT_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+def get_shared_client():
+    """Return the process-wide pooled requests.Session"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _session = requests.Session()
+        _session.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+    return _session
+
+
+def wait_for_backend(timeout: float = 10.0):
+    """Poll /health with capped exponential backoff until the backend answers OK
+
+    Keeps trying until timeout seconds have passed. Returns the last /health response, which may be unhealthy if the
+    backend never answered OK in time. Raises the last
+    requests.RequestException if the backend could not be reached at all.
+    """
+    import requests
+
+    session = get_shared_client()
+    deadline = time.monotonic() + timeout
+    delay = HEALTH_RETRY_DELAY
+    response = None
+    last_error: Optional[Exception] = None
+
+    while True:
+        try:
+            response = session.get(f"{BASE_URL}/health", timeout=1.0)
+            if response.ok:
+                return response
+        except requests.exceptions.RequestException as e:
+            last_error = e
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, HEALTH_RETRY_MAX_DELAY)
+
+    if response is None and last_error is not None:
+        raise last_error
+    return response
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Cached loaders for the Gmail MCP OAuth files in ~/.gmail-mcp
+
+Each file is parsed once per modification: the cache is keyed by the
+file's mtime, so repeated lookups in the same process cost a single stat
+and a rewritten file is picked up automatically.
+"""
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+GMAIL_CONFIG_DIR = Path.home() / ".gmail-mcp"
+CREDENTIALS_FILE = GMAIL_CONFIG_DIR / "gcp-oauth.keys.json"
+TOKEN_FILE = GMAIL_CONFIG_DIR / "token.json"
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class GmailCreds:
+    """OAuth client configuration from gcp-oauth.keys.json"""
+    has_installed: bool
+    client_id: Optional[str] = None
+    project_id: Optional[str] = None
+    client_secret: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class GmailToken:
+    """OAuth token from token.json"""
+    access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+    expiry_date: Optional[int] = None
+
+
+@lru_cache(maxsize=4)
+def _load_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return json.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=4)
+def _load_creds(path: str, mtime_ns: int) -> GmailCreds:
+    with open(path) as f:
+        data = json.load(f)
+
+    installed = data.get("installed")
+    if installed is None:
+        return GmailCreds(has_installed=False)
+
+    return GmailCreds(
+        has_installed=True,
+        client_id=installed.get("client_id"),
+        project_id=installed.get("project_id"),
+        client_secret=installed.get("client_secret"),
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_token(path: str, mtime_ns: int) -> GmailToken:
+    with open(path) as f:
+        data = json.load(f)
+
+    return GmailToken(
+        access_token=data.get("access_token"),
+        refresh_token=data.get("refresh_token"),
+        expiry_date=data.get("expiry_date"),
+    )
+
+
+def load_json(path: PathLike) -> Dict[str, Any]:
+    """Load a raw JSON file, reusing the parse while its mtime and size are unchanged
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    st = os.stat(path)
+    return _load_json(str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_creds(path: PathLike = CREDENTIALS_FILE) -> GmailCreds:
+    """Load the OAuth client configuration, reusing the parse while the file is unchanged"""
+    return _load_creds(str(path), os.stat(path).st_mtime_ns)
+
+
+def load_token(path: PathLike = TOKEN_FILE) -> GmailToken:
+    """Load the OAuth token, reusing the parse while the file is unchanged"""
+    return _load_token(str(path), os.stat(path).st_mtime_ns)
@@ -15,7 +15,6 @@ def main():
     scripts = [
         ("Module Check", "scripts/check_modules.py"),
         ("Gmail Test", "scripts/test_gmail.py"),
-        ("Backend Test", "scripts/test_backend.py"),
         ("Full Diagnostic", "doc_agent/system_diagnostic_report.py"),
         ("Formal Tests", ["python", "-m", "pytest", "test/", "-v"]),
     ]
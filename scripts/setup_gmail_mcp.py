@@ -11,6 +11,44 @@ import subprocess
 from pathlib import Path
 from typing import Dict, Any
 
+# Optional streaming JSON parser for credential files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+OAUTH_REQUIRED_FIELDS = ('client_id', 'project_id', 'client_secret')
+
+
+def read_installed_fields(path: Path, fields=OAUTH_REQUIRED_FIELDS) -> Dict[str, Any]:
+    """Read only the requested fields under 'installed' from an OAuth JSON file.
+    
+    With ijson the file is streamed and parsing stops once every field has
+    been seen; otherwise the whole document is loaded. Missing fields are
+    returned as None.
+    """
+    found: Dict[str, Any] = dict.fromkeys(fields)
+    
+    with open(path, 'rb') as f:
+        if not IJSON_AVAILABLE:
+            installed = json.load(f).get('installed') or {}
+            for field in fields:
+                found[field] = installed.get(field)
+            return found
+        
+        prefixes = {f"installed.{field}": field for field in fields}
+        remaining = len(fields)
+        for prefix, event, value in ijson.parse(f):
+            field = prefixes.get(prefix)
+            if field is not None and event in ('string', 'number') and found[field] is None:
+                found[field] = value
+                remaining -= 1
+                if not remaining:
+                    break
+    
+    return found
+
 def check_credentials() -> bool:
     """Check if Gmail OAuth credentials are properly configured"""
     
@@ -19,35 +57,33 @@ def check_credentials() -> bool:
     
     # Check credentials file in project root
     root_creds = Path("credentials_gmail.json")
-    if not root_creds.exists():
+    if not root_creds.is_file():
         print("❌ credentials_gmail.json not found in project root")
         return False
     
     # Check credentials in Gmail MCP expected location
     mcp_creds = Path.home() / ".gmail-mcp" / "gcp-oauth.keys.json"
-    if not mcp_creds.exists():
+    if not mcp_creds.is_file():
         print("❌ gcp-oauth.keys.json not found in ~/.gmail-mcp/")
         print("   Run: mkdir -p ~/.gmail-mcp && cp credentials_gmail.json ~/.gmail-mcp/gcp-oauth.keys.json")
         return False
     
     # Validate credentials format
     try:
-        with open(mcp_creds, 'r') as f:
-            creds = json.load(f)
+        installed = read_installed_fields(mcp_creds)
         
-        if 'installed' not in creds:
+        if all(value is None for value in installed.values()):
             print("❌ Invalid credentials format - 'installed' key not found")
             return False
         
-        required_fields = ['client_id', 'project_id', 'client_secret']
-        for field in required_fields:
-            if field not in creds['installed']:
+        for field in OAUTH_REQUIRED_FIELDS:
+            if installed[field] is None:
                 print(f"❌ Missing required field: {field}")
                 return False
         
         print("✅ Gmail OAuth credentials found and valid")
-        print(f"   Project ID: {creds['installed']['project_id']}")
-        print(f"   Client ID: {creds['installed']['client_id'][:20]}...")
+        print(f"   Project ID: {installed['project_id']}")
+        print(f"   Client ID: {installed['client_id'][:20]}...")
         return True
         
     except Exception as e:
@@ -60,21 +96,25 @@ def check_gmail_mcp_server() -> bool:
     print("\n🔧 Checking Gmail MCP Server installation...")
     
     mcp_path = Path("mcp_servers/gmail")
-    if not mcp_path.exists():
+    
+    # One readdir for the server directory instead of a stat per child
+    try:
+        with os.scandir(mcp_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
         print("❌ Gmail MCP server not found")
         print("   Run: git clone https://github.com/GongRzhe/Gmail-MCP-Server.git mcp_servers/gmail")
         return False
     
     # Check if npm dependencies are installed
-    node_modules = mcp_path / "node_modules"
-    if not node_modules.exists():
+    if "node_modules" not in entries:
         print("❌ Node.js dependencies not installed")
         print("   Run: cd mcp_servers/gmail && npm install")
         return False
     
     # Check if TypeScript build exists
-    index_js = mcp_path / "dist" / "index.js"
-    if not index_js.exists():
+    dist = entries.get("dist")
+    if dist is None or not dist.is_dir() or not os.path.isfile(os.path.join(dist.path, "index.js")):
         print("❌ TypeScript build not found")
         print("   Run: cd mcp_servers/gmail && npm run build")
         return False
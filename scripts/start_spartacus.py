@@ -9,6 +9,7 @@ import os
 import subprocess
 import time
 import signal
+import selectors
 import threading
 from pathlib import Path
 
@@ -25,6 +26,7 @@ class SpartacusLauncher:
         self.backend_process = None
         self.frontend_process = None
         self.shutdown = False
+        self._pidfds = {}
         
     def start_backend(self):
         """Start the FastAPI backend"""
@@ -48,6 +50,8 @@ class SpartacusLauncher:
                 daemon=True
             ).start()
             
+            self._open_pidfd(self.backend_process, "Backend")
+            
             logger.info("✅ Backend started successfully")
             return True
             
@@ -92,6 +96,8 @@ class SpartacusLauncher:
                 daemon=True
             ).start()
             
+            self._open_pidfd(self.frontend_process, "Frontend")
+            
             logger.info("✅ Frontend started successfully")
             return True
             
@@ -119,6 +125,43 @@ class SpartacusLauncher:
                 logger.error(f"Error monitoring {name}: {e}")
                 break
     
+    def _open_pidfd(self, process, name):
+        """Open a pidfd for process so its exit can be waited on (Linux only)"""
+        if not hasattr(os, "pidfd_open"):
+            return
+        
+        try:
+            self._pidfds[name] = os.pidfd_open(process.pid)
+        except OSError as e:
+            logger.warning(f"pidfd_open not usable for {name}, falling back to polling: {e}")
+    
+    def _wait_for_exit(self):
+        """Block until a child process exits and return its name
+        
+        Uses pidfds, which become readable when the child exits, so the
+        launcher sleeps without waking up while both processes are healthy.
+        Falls back to polling once per second where pidfd_open is unavailable.
+        """
+        processes = {"Backend": self.backend_process, "Frontend": self.frontend_process}
+        processes = {name: proc for name, proc in processes.items() if proc}
+        
+        if processes and all(name in self._pidfds for name in processes):
+            with selectors.DefaultSelector() as sel:
+                for name in processes:
+                    sel.register(self._pidfds[name], selectors.EVENT_READ, name)
+                
+                while not self.shutdown:
+                    for key, _ in sel.select():
+                        return key.data
+            return None
+        
+        while not self.shutdown:
+            for name, process in processes.items():
+                if process.poll() is not None:
+                    return name
+            time.sleep(1)
+        return None
+    
     def wait_for_backend(self, timeout=30):
         """Wait for backend to be ready"""
         import requests
@@ -161,6 +204,10 @@ class SpartacusLauncher:
             except subprocess.TimeoutExpired:
                 self.backend_process.kill()
         
+        for pidfd in self._pidfds.values():
+            os.close(pidfd)
+        self._pidfds.clear()
+        
         logger.info("✅ Cleanup completed")
     
     def run(self):
@@ -186,16 +233,9 @@ class SpartacusLauncher:
             logger.info("💡 Press Ctrl+C to stop")
             
             # Wait for processes
-            while not self.shutdown:
-                if self.backend_process and self.backend_process.poll() is not None:
-                    logger.error("❌ Backend process died!")
-                    break
-                
-                if self.frontend_process and self.frontend_process.poll() is not None:
-                    logger.error("❌ Frontend process died!")
-                    break
-                
-                time.sleep(1)
+            died = self._wait_for_exit()
+            if died:
+                logger.error(f"❌ {died} process died!")
             
             return True
             
@@ -5,146 +5,201 @@ Script to test Gmail integration and authentication
 import sys
 import os
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from _common import ensure_on_path
+from gmail_creds import GMAIL_CONFIG_DIR, load_creds, load_token
+
+log = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _load_json(path: str) -> dict:
+    """Parse a JSON file once per process"""
+    with open(path) as f:
+        return json.load(f)
+
+class Probe(NamedTuple):
+    """Result of checking one path: whether it exists and, if loaded, its content"""
+    path: Path
+    exists: bool
+    data: Optional[Any] = None
+    error: Optional[Exception] = None
+
+def _probe(path: Path, loader: Optional[Callable[[Path], Any]] = None) -> Probe:
+    """Check a path and, if it exists and a loader is given, load it"""
+    if not path.exists():
+        return Probe(path, False)
+    if loader is None:
+        return Probe(path, True)
+    try:
+        return Probe(path, True, loader(path))
+    except Exception as e:
+        return Probe(path, True, error=e)
 
 def test_gmail_integration():
     """Test Gmail MCP server and authentication"""
-    print("📧 GMAIL INTEGRATION TEST")
-    print("=" * 50)
+    log.info("📧 GMAIL INTEGRATION TEST")
+    log.info("=" * 50)
     
-    # Check Gmail MCP server
-    print("🔍 GMAIL MCP SERVER CHECK:")
     mcp_gmail_path = Path.cwd() / "mcp_servers" / "gmail"
+    gmail_config_dir = GMAIL_CONFIG_DIR
+    package_json = mcp_gmail_path / "package.json"
+    dist_path = mcp_gmail_path / "dist"
+    credentials_file = gmail_config_dir / "gcp-oauth.keys.json"
+    token_file = gmail_config_dir / "token.json"
+    
+    # The file checks are independent I/O, so run them concurrently up front
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        probes = {
+            probe.path: probe
+            for probe in executor.map(
+                _probe,
+                [package_json, dist_path, credentials_file, token_file],
+                [lambda path: _load_json(str(path)), None, load_creds, load_token]
+            )
+        }
+    
+    # Check Gmail MCP server
+    log.info("🔍 GMAIL MCP SERVER CHECK:")
     
     if mcp_gmail_path.exists():
-        print(f"  ✅ Gmail MCP directory exists: {mcp_gmail_path}")
+        log.info(f"  ✅ Gmail MCP directory exists: {mcp_gmail_path}")
         
         # Check package.json
-        package_json = mcp_gmail_path / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    pkg_data = json.load(f)
-                print(f"  ✅ Package: {pkg_data.get('name', 'unknown')} v{pkg_data.get('version', 'unknown')}")
-            except Exception as e:
-                print(f"  ⚠️  Could not read package.json: {e}")
+        package_probe = probes[package_json]
+        if package_probe.exists:
+            if package_probe.error is None:
+                pkg_data = package_probe.data
+                log.info(f"  ✅ Package: {pkg_data.get('name', 'unknown')} v{pkg_data.get('version', 'unknown')}")
+            else:
+                log.warning(f"  ⚠️  Could not read package.json: {package_probe.error}")
         
         # Check if built
-        dist_path = mcp_gmail_path / "dist"
-        if dist_path.exists():
-            print(f"  ✅ Built TypeScript files exist")
+        if probes[dist_path].exists:
+            log.info(f"  ✅ Built TypeScript files exist")
         else:
-            print(f"  ❌ TypeScript not built - run 'npm run build'")
+            log.error(f"  ❌ TypeScript not built - run 'npm run build'")
     else:
-        print(f"  ❌ Gmail MCP directory not found")
+        log.error(f"  ❌ Gmail MCP directory not found")
     
-    print()
+    log.info("")
     
     # Check Gmail credentials
-    print("🔑 GMAIL CREDENTIALS CHECK:")
-    gmail_config_dir = Path.home() / ".gmail-mcp"
+    log.info("🔑 GMAIL CREDENTIALS CHECK:")
     
     if gmail_config_dir.exists():
-        print(f"  ✅ Gmail config directory exists: {gmail_config_dir}")
+        log.info(f"  ✅ Gmail config directory exists: {gmail_config_dir}")
         
-        credentials_file = gmail_config_dir / "gcp-oauth.keys.json"
-        if credentials_file.exists():
-            print(f"  ✅ Credentials file exists")
+        credentials_probe = probes[credentials_file]
+        if credentials_probe.exists:
+            log.info(f"  ✅ Credentials file exists")
             
             try:
-                with open(credentials_file) as f:
-                    creds = json.load(f)
+                if credentials_probe.error is not None:
+                    raise credentials_probe.error
+                creds = credentials_probe.data
                 
-                if "installed" in creds:
-                    print(f"  ✅ OAuth client configuration found")
-                    client_id = creds["installed"].get("client_id", "")
+                if creds.has_installed:
+                    log.info(f"  ✅ OAuth client configuration found")
+                    client_id = creds.client_id
                     if client_id:
-                        print(f"  ✅ Client ID: {client_id[:20]}...")
+                        log.info(f"  ✅ Client ID: {client_id[:20]}...")
                     else:
-                        print(f"  ❌ No client ID found")
+                        log.error(f"  ❌ No client ID found")
                 else:
-                    print(f"  ❌ Invalid credentials format")
+                    log.error(f"  ❌ Invalid credentials format")
                     
             except Exception as e:
-                print(f"  ❌ Could not read credentials: {e}")
+                log.error(f"  ❌ Could not read credentials: {e}")
         else:
-            print(f"  ❌ Credentials file not found")
+            log.error(f"  ❌ Credentials file not found")
             
         # Check for access token
-        token_file = gmail_config_dir / "token.json"
-        if token_file.exists():
-            print(f"  ✅ Access token file exists")
-            try:
-                with open(token_file) as f:
-                    token_data = json.load(f)
-                if "access_token" in token_data:
-                    print(f"  ✅ Access token available")
-                else:
-                    print(f"  ❌ No access token in file")
-            except Exception as e:
-                print(f"  ⚠️  Could not read token file: {e}")
+        token_probe = probes[token_file]
+        if token_probe.exists:
+            log.info(f"  ✅ Access token file exists")
+            if token_probe.error is not None:
+                log.warning(f"  ⚠️  Could not read token file: {token_probe.error}")
+            elif token_probe.data.access_token:
+                log.info(f"  ✅ Access token available")
+            else:
+                log.error(f"  ❌ No access token in file")
         else:
-            print(f"  ❌ No access token file found")
+            log.error(f"  ❌ No access token file found")
     else:
-        print(f"  ❌ Gmail config directory not found")
+        log.error(f"  ❌ Gmail config directory not found")
     
-    print()
+    log.info("")
     
     # Test Gmail tools import
-    print("🛠️  GMAIL TOOLS CHECK:")
+    log.info("🛠️  GMAIL TOOLS CHECK:")
     try:
-        current_dir = Path(__file__).parent.parent
-        sys.path.insert(0, str(current_dir))
+        ensure_on_path()
         
         from agentic_lib.gmail_tools import gmail_send_tool, gmail_search_tool, gmail_read_tool
-        print(f"  ✅ Gmail tools imported successfully")
-        print(f"  ✅ Available tools: gmail_send, gmail_search, gmail_read")
+        log.info(f"  ✅ Gmail tools imported successfully")
+        log.info(f"  ✅ Available tools: gmail_send, gmail_search, gmail_read")
         
         # Test tool creation
         tools = [gmail_send_tool, gmail_search_tool, gmail_read_tool]
         for tool in tools:
-            print(f"  ✅ Tool {tool.name} created successfully")
+            log.info(f"  ✅ Tool {tool.name} created successfully")
             
     except ImportError as e:
-        print(f"  ❌ Could not import Gmail tools: {e}")
+        log.error(f"  ❌ Could not import Gmail tools: {e}")
     except Exception as e:
-        print(f"  ❌ Error testing Gmail tools: {e}")
+        log.error(f"  ❌ Error testing Gmail tools: {e}")
     
-    print()
-    print("🔧 GMAIL TEST COMPLETE")
+    log.info("")
+    log.info("🔧 GMAIL TEST COMPLETE")
 
 def test_gmail_mcp_server():
     """Test Gmail MCP server directly"""
-    print("\n🚀 TESTING GMAIL MCP SERVER DIRECTLY:")
+    log.info("\n🚀 TESTING GMAIL MCP SERVER DIRECTLY:")
     
     mcp_path = Path.cwd() / "mcp_servers" / "gmail"
     if not mcp_path.exists():
-        print("  ❌ Gmail MCP server not found")
+        log.error("  ❌ Gmail MCP server not found")
         return
     
-    print(f"  📁 Testing in: {mcp_path}")
+    log.info(f"  📁 Testing in: {mcp_path}")
     
-    # Test if we can run the auth command
+    # Check the auth script is declared instead of spawning npm to find out
     try:
-        import subprocess
-        result = subprocess.run(
-            ["npm", "run", "auth", "--help"], 
-            cwd=mcp_path, 
-            capture_output=True, 
-            text=True,
-            timeout=10
-        )
+        pkg_data = _load_json(str(mcp_path / "package.json"))
         
-        if result.returncode == 0:
-            print("  ✅ Gmail MCP auth command available")
+        if "auth" in pkg_data.get("scripts", {}):
+            log.info("  ✅ Gmail MCP auth command available")
         else:
-            print(f"  ⚠️  Gmail MCP auth command issue: {result.stderr}")
+            log.warning("  ⚠️  Gmail MCP auth command issue: no 'auth' script in package.json")
+        
+        if not (mcp_path / "node_modules" / ".bin").is_dir():
+            log.warning("  ⚠️  Node.js dependencies not installed - run 'npm install'")
             
-    except subprocess.TimeoutExpired:
-        print("  ⚠️  Gmail MCP auth command timed out")
+    except FileNotFoundError:
+        log.error("  ❌ Could not test Gmail MCP: package.json not found")
     except Exception as e:
-        print(f"  ❌ Could not test Gmail MCP: {e}")
+        log.error(f"  ❌ Could not test Gmail MCP: {e}")
 
-if __name__ == "__main__":
+def main():
+    """Run the Gmail checks
+    
+    Output goes through logging: -q keeps only warnings and errors, -v adds
+    debug output, and LOG_LEVEL sets the level explicitly.
+    """
+    level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    if "-q" in sys.argv[1:]:
+        level = "WARNING"
+    elif "-v" in sys.argv[1:]:
+        level = "DEBUG"
+    logging.basicConfig(level=level, format="%(message)s")
+    
     test_gmail_integration()
-    test_gmail_mcp_server() 
\ No newline at end of file
+    test_gmail_mcp_server()
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
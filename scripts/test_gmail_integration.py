@@ -4,21 +4,27 @@ Test script for Gmail MCP integration in Spartacus Desktop
 """
 
 import asyncio
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from spartacus_backend.services.agent_manager import SpartacusAgentManager
+from _common import ensure_on_path
 
-async def test_gmail_integration():
-    """Test Gmail integration with Spartacus"""
+async def test_gmail_integration(agent_manager=None):
+    """Test Gmail integration with Spartacus
+    
+    Pass an initialized SpartacusAgentManager to reuse it; it is only
+    cleaned up here if this function created it.
+    """
     
     print("🧪 Testing Gmail Integration with Spartacus")
     print("=" * 60)
     
-    # Initialize agent manager
-    agent_manager = SpartacusAgentManager()
-    await agent_manager.initialize()
+    owns_manager = agent_manager is None
+    if owns_manager:
+        # Imported here so loading this module does not pull in the backend
+        ensure_on_path()
+        from spartacus_backend.services.agent_manager import SpartacusAgentManager
+        
+        agent_manager = SpartacusAgentManager()
+        await agent_manager.initialize()
     
     print(f"\n📊 Agent Manager Status:")
     print(f"   Agents: {len(agent_manager.agents)}")
@@ -46,7 +52,7 @@ async def test_gmail_integration():
             )
             
             print(f"📧 Email Agent Response:")
-            print(f"   {result.get('response', 'No response')}")
+            print(f"   {result.response}")
             
         except Exception as e:
             print(f"❌ Error testing email agent: {e}")
@@ -55,7 +61,8 @@ async def test_gmail_integration():
         print(f"\n❌ No email agent found")
     
     # Cleanup
-    await agent_manager.cleanup()
+    if owns_manager:
+        await agent_manager.cleanup()
     print(f"\n✅ Test completed")
 
 if __name__ == "__main__":
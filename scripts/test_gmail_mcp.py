@@ -3,22 +3,29 @@
 Test Gmail MCP connection with the correct protocol
 """
 import asyncio
-import sys
 import os
-from pathlib import Path
+from typing import Optional, TYPE_CHECKING
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from _common import ensure_on_path
 
-from spartacus_backend.services.mcp_gmail_client import GmailMCPClient
+if TYPE_CHECKING:
+    from spartacus_backend.services.mcp_gmail_client import GmailMCPClient
 
-async def test_mcp_connection():
-    """Test MCP connection using the corrected client"""
+async def test_mcp_connection(client: Optional["GmailMCPClient"] = None):
+    """Test MCP connection using the corrected client
+    
+    Pass an already started client to reuse its server process; the
+    server is only stopped here if this function started it.
+    """
     print("🧪 Testing Gmail MCP Connection")
     print("=" * 50)
     
-    client = GmailMCPClient()
+    owns_client = client is None
+    if owns_client:
+        # Imported here so loading this module does not pull in the backend
+        ensure_on_path()
+        from spartacus_backend.services.mcp_gmail_client import GmailMCPClient
+        client = GmailMCPClient()
     
     try:
         print("🚀 Starting MCP server...")
@@ -47,9 +54,10 @@ async def test_mcp_connection():
         traceback.print_exc()
         
     finally:
-        print("\n🛑 Stopping MCP server...")
-        await client.stop_server()
-        print("✅ MCP server stopped")
+        if owns_client:
+            print("\n🛑 Stopping MCP server...")
+            await client.stop_server()
+            print("✅ MCP server stopped")
 
 if __name__ == "__main__":
     asyncio.run(test_mcp_connection()) 
\ No newline at end of file
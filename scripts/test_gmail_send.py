@@ -3,13 +3,16 @@
 Test script to send a Gmail email directly using the Gmail tools
 """
 
-import sys
 import os
-sys.path.append('/Users/a.lumbreras/Code/personal/spartacus')
+
+from _common import ensure_on_path
+ensure_on_path()
 
 from agentic_lib.gmail_tools import gmail_send_function, GmailSendInput
+from spartacus_services.context import Context
 
-async def test_gmail_send():
+async def test_gmail_send(gmail_client=None):
+    """Send a test email, reusing gmail_client's MCP server if one is given"""
     print("🧪 Testing Gmail Send functionality...")
     
     # Test email data
@@ -32,8 +35,11 @@ Saludos desde Spartacus! 🏛️"""
         print(f"📄 Subject: {email_args.subject}")
         print("🔄 Executing Gmail send...")
         
-        # Pass None as context since it's not used in our function
-        result = await gmail_send_function(None, email_args)
+        # The tool picks the shared Gmail client up from the session data
+        ctx = Context()
+        if gmail_client is not None:
+            ctx.session_data["gmail_client"] = gmail_client
+        result = await gmail_send_function(ctx, email_args)
         
         print("✅ Gmail send function completed!")
         print(f"📊 Result: {result}")
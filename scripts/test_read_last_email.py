@@ -4,26 +4,25 @@ Test reading the last email via Spartacus API to ensure it's not a mock response
 """
 import requests
 import json
-import time
+
+from _common import BASE_URL, get_shared_client, wait_for_backend
 
 def test_read_last_email():
     """Test reading the last email via the Spartacus API"""
     print("🧪 Testing Read Last Email functionality via Spartacus API")
     print("=" * 60)
 
-    base_url = "http://127.0.0.1:8000"
-    
-    # Health check
+    # Health check, retried with exponential backoff in case the backend
+    # was just launched and is still starting up
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
-        if response.status_code == 200:
-            print(f"✅ Backend healthy: {response.json()}")
-        else:
-            print(f"❌ Backend unhealthy: {response.status_code}")
-            return
+        response = wait_for_backend()
     except requests.exceptions.RequestException as e:
         print(f"❌ Cannot reach backend: {e}")
         return
+    if not response.ok:
+        print(f"❌ Backend unhealthy: {response.status_code}")
+        return
+    print(f"✅ Backend healthy: {response.json()}")
 
     # Ask the agent to read the last email
     print("\n💬 Sending request: 'lee mi ultimo email'")
@@ -33,8 +32,8 @@ def test_read_last_email():
     }
     
     try:
-        response = requests.post(
-            f"{base_url}/api/chat/message",
+        response = get_shared_client().post(
+            f"{BASE_URL}/api/chat/message",
             json=payload,
             timeout=120  # Increased timeout for the agent to process
         )
@@ -67,6 +66,4 @@ def test_read_last_email():
         print(f"❌ An unexpected error occurred: {e}")
 
 if __name__ == "__main__":
-    # Ensure backend is running before testing
-    time.sleep(5)  # Give backend a moment to start if just launched
     test_read_last_email() 
\ No newline at end of file
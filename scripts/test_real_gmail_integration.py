@@ -2,21 +2,35 @@
 """
 Test real Gmail integration through Spartacus API
 """
-import requests
+import asyncio
 import json
 import time
 
-def test_real_gmail_integration():
+import httpx
+
+from _common import BASE_URL
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+async def test_real_gmail_integration():
     """Test Gmail integration through the actual Spartacus API"""
     print("🧪 Testing REAL Gmail Integration via Spartacus API")
     print("=" * 60)
     
-    base_url = "http://127.0.0.1:8000"
-    
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=HTTP2_AVAILABLE, timeout=30) as client:
+        return await _run_checks(client)
+
+async def _run_checks(client: httpx.AsyncClient):
+    """Run the health check and both chat probes over one client"""
     # Test health check first
     print("🔍 Checking backend health...")
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = await client.get("/health", timeout=5)
         if response.status_code == 200:
             print(f"✅ Backend healthy: {response.json()}")
         else:
@@ -26,20 +40,29 @@ def test_real_gmail_integration():
         print(f"❌ Cannot reach backend: {e}")
         return False
     
-    # Test Gmail integration via chat API
-    print("\n📧 Testing Gmail search via chat API...")
+    # The search and read probes are independent, so run them concurrently
+    # and wait for the slower one instead of the sum of both
+    print("\n📧 Testing Gmail search and email reading via chat API...")
     
-    chat_payload = {
+    search_payload = {
         "message": "Busca emails en mi inbox",
         "agent_id": "default"
     }
+    read_payload = {
+        "message": "Lee el primer email de mi inbox",
+        "agent_id": "default"
+    }
+    search_result, read_result = await asyncio.gather(
+        client.post("/api/chat/message", json=search_payload),
+        client.post("/api/chat/message", json=read_payload),
+        return_exceptions=True
+    )
     
+    # Check the search result
     try:
-        response = requests.post(
-            f"{base_url}/api/chat/message",
-            json=chat_payload,
-            timeout=30
-        )
+        response = search_result
+        if isinstance(response, BaseException):
+            raise response
         
         if response.status_code == 200:
             result = response.json()
@@ -62,20 +85,11 @@ def test_real_gmail_integration():
         print(f"❌ Gmail search error: {e}")
         return False
     
-    # Test reading specific email
-    print("\n📖 Testing email reading via chat API...")
-    
-    read_payload = {
-        "message": "Lee el primer email de mi inbox",
-        "agent_id": "default"
-    }
-    
+    # Check the read result
     try:
-        response = requests.post(
-            f"{base_url}/api/chat/message",
-            json=read_payload,
-            timeout=30
-        )
+        response = read_result
+        if isinstance(response, BaseException):
+            raise response
         
         if response.status_code == 200:
             result = response.json()
@@ -98,4 +112,4 @@ def test_real_gmail_integration():
     return True
 
 if __name__ == "__main__":
-    test_real_gmail_integration() 
\ No newline at end of file
+    asyncio.run(test_real_gmail_integration()) 
\ No newline at end of file
@@ -2,23 +2,21 @@
 """
 Verify Gmail authentication completion
 """
-import json
-from pathlib import Path
+from gmail_creds import CREDENTIALS_FILE, load_json
 
 def verify_gmail_auth():
     """Check if Gmail OAuth token exists and is valid"""
     print("🔍 VERIFICANDO AUTENTICACIÓN GMAIL")
     print("=" * 40)
     
-    token_file = Path.home() / ".gmail-mcp" / "gcp-oauth.keys.json"
+    token_file = CREDENTIALS_FILE
     
     if not token_file.exists():
         print("❌ No existe archivo de token")
         return False
     
     try:
-        with open(token_file) as f:
-            token_data = json.load(f)
+        token_data = load_json(token_file)
         
         print(f"📄 Token file: {token_file}")
         print(f"🔑 Keys found: {list(token_data.keys())}")
@@ -3,32 +3,88 @@ Chat API Router
 Endpoints for chat functionality and messaging
 """
 
-from fastapi import APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from typing import List, Dict, Any, Optional
-import uuid
+import asyncio
+from secrets import token_hex
 import json
+from collections import deque
 from datetime import datetime
 
-from spartacus_backend.models.requests import ChatMessageRequest, AgentType
+# Use orjson for WebSocket frames when available, stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+from spartacus_backend.models.requests import ChatMessageRequest, AgentType, CHAT_MESSAGE_ADAPTER
 from spartacus_backend.models.responses import (
     ChatResponse, ChatMessage, ChatHistoryResponse, BaseResponse, ResponseStatus
 )
 from spartacus_backend.services.agent_manager import SpartacusAgentManager
-from spartacus_backend.dependencies import get_agent_manager
+from spartacus_backend.config.settings import settings
+from spartacus_backend.dependencies import get_agent_manager, json_body
+from spartacus_backend.api import examples
+from spartacus_backend.api.routing import ErrorHandlingRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
 
-# Simple in-memory chat storage (would be replaced with database in production)
-chat_sessions: Dict[str, List[Dict[str, Any]]] = {}
+# Simple in-memory chat storage (would be replaced with database in production).
+# Each session keeps only its last settings.max_chat_history messages.
+chat_sessions: Dict[str, deque] = {}
+
+# Session IDs in creation order, maintained on write so listing is free
+_session_order: List[str] = []
 
 # Active WebSocket connections
 active_connections: Dict[str, WebSocket] = {}
 
 
-@router.post("/message", response_model=ChatResponse)
+class _AgentRunLimiter:
+    """Caps concurrent agent runs at settings.max_agents
+    
+    The limit is read on every acquire, so a max_agents change made through
+    POST /api/system/config applies to the next run without a restart.
+    """
+    
+    def __init__(self):
+        self.running = 0
+        self._cond = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.running < settings.max_agents)
+            self.running += 1
+    
+    async def __aexit__(self, *exc_info):
+        # Freed before taking the lock, so a cancelled exit cannot leak the slot
+        self.running -= 1
+        async with self._cond:
+            # Every waiter re-checks, in case the limit was raised meanwhile
+            self._cond.notify_all()
+
+
+# Caps concurrent agent runs across the REST and WebSocket chat endpoints
+_agent_run_limit = _AgentRunLimiter()
+
+
+@router.post(
+    "/message",
+    response_model=ChatResponse,
+    responses=examples.CHAT_RESPONSE,
+    openapi_extra=examples.request_body(ChatMessageRequest, examples.CHAT_MESSAGE_REQUEST)
+)
 async def send_message(
-    request: ChatMessageRequest,
+    request: ChatMessageRequest = Depends(json_body(CHAT_MESSAGE_ADAPTER)),
     agent_manager: SpartacusAgentManager = Depends(get_agent_manager)
 ):
     """
@@ -37,86 +93,75 @@ async def send_message(
     Process a user message through the specified agent and return the response.
     Maintains chat history and session context.
     """
-    try:
-        # Generate session ID if not provided
-        session_id = request.session_id or f"chat-{uuid.uuid4().hex[:8]}"
-        
-        # Generate message ID
-        message_id = f"msg-{uuid.uuid4().hex[:8]}"
-        
-        # Store user message
-        user_message = ChatMessage(
-            id=message_id,
-            role="user",
-            content=request.message,
-            timestamp=datetime.now(),
-            agent_type=None,
-            tools_used=[]
-        )
-        chat_sessions[session_id] = chat_sessions.get(session_id, []) + [user_message]
-        
-        # Get chat context for agent
-        chat_context = chat_sessions[session_id]
-        
-        # Run agent with user input
+    # Generate session ID if not provided
+    session_id = request.session_id or f"chat-{token_hex(4)}"
+    
+    # Generate message ID
+    message_id = f"msg-{token_hex(4)}"
+    
+    # Store user message as a plain dict; messages are built here from
+    # trusted values, so responses wrap them with model_construct and skip
+    # re-validating every message on every read
+    session_messages = chat_sessions.get(session_id)
+    if session_messages is None:
+        _session_order.append(session_id)
+        session_messages = chat_sessions[session_id] = deque(maxlen=settings.max_chat_history)
+    session_messages.append({
+        "id": message_id,
+        "role": "user",
+        "content": request.message,
+        "timestamp": datetime.now(),
+        "agent_type": None,
+        "tools_used": ()
+    })
+    
+    # Run agent with user input
+    async with _agent_run_limit:
         result = await agent_manager.run_agent(
             user_input=request.message,
-            agent_type=request.agent_type.value,
+            agent_type=request.agent_type,
             context=request.context or {},
             session_id=session_id,
             max_iterations=10
         )
-        
-        # Create assistant message
-        assistant_message_id = f"msg-{uuid.uuid4().hex[:8]}"
-        assistant_message = ChatMessage(
-            id=assistant_message_id,
-            role="assistant",
-            content=result["response"],
-            timestamp=datetime.now(),
-            agent_type=result["agent_type"],
-            tools_used=result["tools_used"]
-        )
-        
-        # Store assistant message
-        chat_sessions[session_id] = chat_sessions[session_id] + [assistant_message]
-        
-        return ChatResponse(
-            status=ResponseStatus.SUCCESS,
-            session_id=session_id,
-            message=assistant_message
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process message: {str(e)}"
-        )
+    
+    # Create assistant message
+    assistant_message_id = f"msg-{token_hex(4)}"
+    assistant_message = {
+        "id": assistant_message_id,
+        "role": "assistant",
+        "content": result.response,
+        "timestamp": datetime.now(),
+        "agent_type": result.agent_type,
+        "tools_used": result.tools_used
+    }
+    
+    # Store assistant message
+    session_messages.append(assistant_message)
+    
+    return ChatResponse(
+        status=ResponseStatus.SUCCESS,
+        session_id=session_id,
+        message=ChatMessage.model_construct(**assistant_message)
+    )
 
 
-@router.get("/history/{session_id}", response_model=ChatHistoryResponse)
+@router.get("/history/{session_id}", response_model=ChatHistoryResponse, responses=examples.CHAT_HISTORY_RESPONSE)
 async def get_chat_history(session_id: str):
     """
     Get chat history for a session
     
     Retrieve all messages from the specified chat session.
     """
-    try:
-        messages = chat_sessions.get(session_id, [])
-        
-        return ChatHistoryResponse(
-            status=ResponseStatus.SUCCESS,
-            message="Chat history retrieved successfully",
-            session_id=session_id,
-            messages=messages,
-            total_messages=len(messages)
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve chat history: {str(e)}"
-        )
+    messages = [ChatMessage.model_construct(**m) for m in chat_sessions.get(session_id, ())]
+    
+    return ChatHistoryResponse(
+        status=ResponseStatus.SUCCESS,
+        message="Chat history retrieved successfully",
+        session_id=session_id,
+        messages=messages,
+        total_messages=len(messages)
+    )
 
 
 @router.post("/clear/{session_id}", response_model=BaseResponse)
@@ -126,37 +171,26 @@ async def clear_chat_history(session_id: str):
     
     Remove all messages from the specified chat session.
     """
-    try:
-        chat_sessions[session_id] = []
-        
-        return BaseResponse(
-            status=ResponseStatus.SUCCESS,
-            message=f"Chat history cleared for session {session_id}"
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to clear chat history: {str(e)}"
-        )
+    if session_id in chat_sessions:
+        chat_sessions[session_id].clear()
+    else:
+        _session_order.append(session_id)
+        chat_sessions[session_id] = deque(maxlen=settings.max_chat_history)
+    
+    return BaseResponse(
+        status=ResponseStatus.SUCCESS,
+        message=f"Chat history cleared for session {session_id}"
+    )
 
 
-@router.get("/sessions", response_model=List[Dict[str, Any]])
+@router.get("/sessions", response_model=List[str])
 async def list_chat_sessions():
     """
     List all active chat sessions
     
     Returns a list of all chat sessions with their metadata.
     """
-    try:
-        sessions = list(chat_sessions.keys())
-        return sessions
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to list chat sessions: {str(e)}"
-        )
+    return _session_order
 
 
 @router.websocket("/stream")
@@ -165,58 +199,82 @@ async def websocket_endpoint(websocket: WebSocket):
     WebSocket endpoint for real-time chat streaming
     
     Enables real-time bidirectional communication for chat messages.
+    Messages sent with "stream": true get "delta" frames followed by a
+    "done" frame instead of a single "agent_response" frame.
     """
     await websocket.accept()
-    connection_id = f"ws-{uuid.uuid4().hex[:8]}"
+    connection_id = f"ws-{token_hex(4)}"
     active_connections[connection_id] = websocket
     
+    # Resolved once per connection rather than per message
+    agent_manager = getattr(websocket.app.state, "agent_manager", None)
+    
     try:
         while True:
             # Receive message from client
             data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = _loads(data)
+            
+            # One timestamp per turn, shared by every frame sent for it
+            timestamp = datetime.now().isoformat()
             
             # Extract message information
             user_message = message_data.get("message", "")
-            session_id = message_data.get("session_id", f"ws-{uuid.uuid4().hex[:8]}")
+            session_id = message_data.get("session_id") or f"ws-{token_hex(4)}"
             agent_type = message_data.get("agent_type", "default")
+            stream = bool(message_data.get("stream")) and settings.enable_streaming
             
             # Send acknowledgment
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(_dumps({
                 "type": "message_received",
                 "session_id": session_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }))
             
             try:
-                # Get agent manager
-                agent_manager = get_agent_manager()
-                
-                # Process message through agent
-                result = await agent_manager.run_agent(
-                    user_input=user_message,
-                    agent_type=agent_type,
-                    session_id=session_id
-                )
+                if agent_manager is None:
+                    raise RuntimeError("Agent manager not initialized")
                 
-                # Send response back to client
-                await websocket.send_text(json.dumps({
-                    "type": "agent_response",
-                    "session_id": session_id,
-                    "message": result["response"],
-                    "agent_type": result["agent_type"],
-                    "tools_used": result["tools_used"],
-                    "execution_time": result["execution_time"],
-                    "timestamp": datetime.now().isoformat()
-                }))
+                # Bound the whole turn so a stuck agent cannot hold its
+                # concurrency slot forever
+                async with asyncio.timeout(settings.agent_timeout), _agent_run_limit:
+                    if stream:
+                        async for event in agent_manager.run_agent_stream(
+                            user_input=user_message,
+                            agent_type=agent_type,
+                            session_id=session_id
+                        ):
+                            await websocket.send_text(_dumps({
+                                **event,
+                                "session_id": session_id,
+                                "timestamp": timestamp
+                            }))
+                    else:
+                        # Process message through agent
+                        result = await agent_manager.run_agent(
+                            user_input=user_message,
+                            agent_type=agent_type,
+                            session_id=session_id
+                        )
+                        
+                        # Send response back to client
+                        await websocket.send_text(_dumps({
+                            "type": "agent_response",
+                            "session_id": session_id,
+                            "message": result.response,
+                            "agent_type": result.agent_type,
+                            "tools_used": result.tools_used,
+                            "execution_time": result.execution_time,
+                            "timestamp": timestamp
+                        }))
                 
             except Exception as e:
                 # Send error message
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(_dumps({
                     "type": "error",
                     "session_id": session_id,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
+                    "error": f"Agent timed out after {settings.agent_timeout}s" if isinstance(e, TimeoutError) else str(e),
+                    "timestamp": timestamp
                 }))
                 
     except WebSocketDisconnect:
@@ -231,15 +289,17 @@ async def broadcast_to_session(session_id: str, message: Dict[str, Any]):
     """
     Broadcast a message to all WebSocket connections for a session
     """
-    message_json = json.dumps(message)
-    connections_to_remove = []
+    message_json = _dumps(message)
     
-    for connection_id, websocket in active_connections.items():
-        try:
-            await websocket.send_text(message_json)
-        except Exception:
-            connections_to_remove.append(connection_id)
+    # Send to every connection concurrently; a snapshot of the items keeps
+    # the dict safe to modify while the sends are in flight
+    connections = list(active_connections.items())
+    results = await asyncio.gather(
+        *(websocket.send_text(message_json) for _, websocket in connections),
+        return_exceptions=True
+    )
     
     # Clean up disconnected connections
-    for connection_id in connections_to_remove:
-        del active_connections[connection_id] 
\ No newline at end of file
+    for (connection_id, _), result in zip(connections, results):
+        if isinstance(result, Exception):
+            active_connections.pop(connection_id, None)
@@ -0,0 +1,154 @@
+"""
+OpenAPI examples for the API routes
+
+Kept here and attached to the routes rather than embedded in the models, so
+the models stay plain and the examples are only used when the OpenAPI schema
+is generated.
+"""
+
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+
+def _inline_refs(schema: Any, defs: Dict[str, Any]) -> Any:
+    """Replace local "#/$defs/..." references with the definitions themselves"""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if ref is not None and ref.startswith("#/$defs/"):
+            resolved = dict(defs[ref[len("#/$defs/"):]])
+            resolved.update((k, v) for k, v in schema.items() if k != "$ref")
+            return _inline_refs(resolved, defs)
+        return {k: _inline_refs(v, defs) for k, v in schema.items()}
+    if isinstance(schema, list):
+        return [_inline_refs(item, defs) for item in schema]
+    return schema
+
+
+def request_body(model: Type[BaseModel], examples: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the `openapi_extra=` request body for a route that validates the raw body itself
+
+    Such routes take no body parameter, so FastAPI cannot document one.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": _inline_refs(schema, defs),
+                    "examples": examples
+                }
+            }
+        }
+    }
+
+
+def _response_example(example: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Wrap an example body in the `responses=` structure for a 200 response"""
+    return {200: {"content": {"application/json": {"example": example}}}}
+
+
+# Request bodies (Body(openapi_examples=...))
+
+AGENT_RUN_REQUEST = {
+    "analysis": {
+        "summary": "Run an analysis agent",
+        "value": {
+            "user_input": "Help me analyze this data",
+            "agent_type": "analysis",
+            "context": {"data_source": "file.csv"},
+            "session_id": "chat-123",
+            "max_iterations": 5
+        }
+    }
+}
+
+AGENT_CREATE_REQUEST = {
+    "custom": {
+        "summary": "Create a custom agent",
+        "value": {
+            "name": "my_custom_agent",
+            "description": "A specialized agent for data analysis",
+            "instructions": "You are an expert data analyst...",
+            "tools": ["python_executor", "file_reader"],
+            "model": "gpt-4",
+            "temperature": 0.3
+        }
+    }
+}
+
+CHAT_MESSAGE_REQUEST = {
+    "default": {
+        "summary": "Send a chat message",
+        "value": {
+            "message": "Hello, can you help me?",
+            "session_id": "chat-123",
+            "agent_type": "default",
+            "context": {}
+        }
+    }
+}
+
+TOOL_EXECUTE_REQUEST = {
+    "python": {
+        "summary": "Execute a tool",
+        "value": {
+            "tool_name": "python_executor",
+            "parameters": {"code": "print('Hello World')"},
+            "context": {"session_id": "tool-session-123"}
+        }
+    }
+}
+
+CONFIG_UPDATE_REQUEST = {
+    "model": {
+        "summary": "Update LLM settings",
+        "value": {
+            "settings": {
+                "default_model": "gpt-4-turbo",
+                "temperature": 0.5,
+                "max_tokens": 8000
+            }
+        }
+    }
+}
+
+
+# Responses (route responses=...)
+
+AGENT_RUN_RESPONSE = _response_example({
+    "status": "success",
+    "message": "Agent execution completed",
+    "timestamp_ns": 1705314600000000000,
+    "agent_id": "agent-run-123",
+    "agent_type": "analysis",
+    "response": "Based on the data analysis...",
+    "iterations": 3,
+    "execution_time": 12.5,
+    "tools_used": ["python_executor", "data_analyzer"],
+    "context": {"analysis_result": "completed"}
+})
+
+CHAT_RESPONSE = _response_example({
+    "status": "success",
+    "timestamp_ns": 1705314600000000000,
+    "session_id": "chat-123",
+    "message": {
+        "id": "msg-456",
+        "role": "assistant",
+        "content": "Hello! How can I help you?",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "agent_type": "default",
+        "tools_used": []
+    }
+})
+
+CHAT_HISTORY_RESPONSE = _response_example({
+    "status": "success",
+    "timestamp_ns": 1705314600000000000,
+    "session_id": "chat-123",
+    "messages": [],
+    "total_messages": 0
+})
@@ -0,0 +1,42 @@
+"""
+Route class shared by the API routers
+"""
+
+import traceback
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from spartacus_services.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ErrorHandlingRoute(APIRoute):
+    """APIRoute that turns unexpected endpoint errors into a 500 response
+
+    The error is converted inside the route, so the response still passes
+    through CORSMiddleware and the frontend can read it. An app-level
+    Exception handler runs outside CORSMiddleware, and its 500s would
+    reach the browser without CORS headers. HTTPException and request
+    validation errors are left to FastAPI's own handlers.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                detail = f"{request.url.path} failed: {e}"
+                logger.error(detail, traceback=traceback.format_exc())
+                return JSONResponse(status_code=500, content={"detail": detail})
+
+        return route_handler
@@ -3,38 +3,39 @@ System API Router
 Endpoints for system management and monitoring
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, Body, HTTPException, Depends, Response
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any, List, Optional
+import json
+import logging
+import os
 
 from spartacus_backend.models.requests import ConfigUpdateRequest
 from spartacus_backend.models.responses import SystemStatusResponse, BaseResponse, ResponseStatus
 from spartacus_backend.services.agent_manager import SpartacusAgentManager
-from spartacus_backend.config.settings import settings
+from spartacus_backend.config.settings import LOG_FILE_NAME, Settings, settings
 from spartacus_backend.dependencies import get_agent_manager
+from spartacus_backend.api import examples
+from spartacus_backend.api.routing import ErrorHandlingRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
+
+# The health payload never changes, so it is encoded once at import
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "message": "Spartacus Backend is running",
+    "version": "1.0.0"
+}).encode()
 
 
 @router.get("/health")
-async def health_check(
-    agent_manager: SpartacusAgentManager = Depends(get_agent_manager)
-):
+async def health_check():
     """
     System health check
     
     Basic health check endpoint that returns system status.
     """
-    try:
-        return {
-            "status": "healthy",
-            "message": "Spartacus Backend is running",
-            "version": "1.0.0"
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Health check failed: {str(e)}"
-        )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/status", response_model=SystemStatusResponse)
@@ -46,20 +47,16 @@ async def get_system_status(
     
     Returns comprehensive system status including resource usage and agent metrics.
     """
-    try:
-        status_data = agent_manager.get_system_status()
-        
-        return SystemStatusResponse(
-            status=ResponseStatus.SUCCESS,
-            message="System status retrieved successfully",
-            **status_data
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get system status: {str(e)}"
-        )
+    status_data = agent_manager.get_system_status()
+    # The manager's "status" is its health, not the response status
+    status_data.pop("status", None)
+    
+    return SystemStatusResponse(
+        status=ResponseStatus.SUCCESS,
+        message="System status retrieved successfully",
+        version="1.0.0",
+        **status_data
+    )
 
 
 @router.get("/config")
@@ -69,60 +66,55 @@ async def get_configuration():
     
     Returns the current system configuration settings.
     """
-    try:
-        config_dict = {
-            "host": settings.host,
-            "port": settings.port,
-            "cors_origins": settings.cors_origins,
-            "max_agents": settings.max_agents,
-            "agent_timeout": settings.agent_timeout,
-            "max_chat_history": settings.max_chat_history,
-            "enable_streaming": settings.enable_streaming,
-            "default_model": settings.default_model,
-            "max_tokens": settings.max_tokens,
-            "temperature": settings.temperature,
-            "data_dir": settings.data_dir,
-            "logs_dir": settings.logs_dir
-        }
-        
-        return {
-            "status": ResponseStatus.SUCCESS,
-            "message": "Configuration retrieved successfully",
-            "configuration": config_dict
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get configuration: {str(e)}"
-        )
+    config_dict = {
+        "host": settings.host,
+        "port": settings.port,
+        "cors_origins": settings.cors_origins,
+        "max_agents": settings.max_agents,
+        "agent_timeout": settings.agent_timeout,
+        "max_chat_history": settings.max_chat_history,
+        "enable_streaming": settings.enable_streaming,
+        "default_model": settings.default_model,
+        "max_tokens": settings.max_tokens,
+        "temperature": settings.temperature,
+        "data_dir": settings.data_dir,
+        "logs_dir": settings.logs_dir
+    }
+    
+    return {
+        "status": ResponseStatus.SUCCESS,
+        "message": "Configuration retrieved successfully",
+        "configuration": config_dict
+    }
 
 
 @router.post("/config", response_model=BaseResponse)
-async def update_configuration(request: ConfigUpdateRequest):
+async def update_configuration(
+    request: ConfigUpdateRequest = Body(openapi_examples=examples.CONFIG_UPDATE_REQUEST)
+):
     """
     Update system configuration
     
     Update system configuration settings. Changes may require restart.
     """
     try:
-        # Update settings (in a real implementation, this would persist changes)
-        updated_settings = []
-        
-        for key, value in request.settings.items():
-            if hasattr(settings, key):
-                setattr(settings, key, value)
-                updated_settings.append(key)
+        # Update settings (in a real implementation, this would persist changes).
+        # Unknown keys are dropped and the rest converted in a single pass, then
+        # applied together so readers never see a partially applied update.
+        validated = Settings.parse_values(request.settings)
+        for key, value in validated.items():
+            setattr(settings, key, value)
+        updated_settings = sorted(validated)
         
         return BaseResponse(
             status=ResponseStatus.SUCCESS,
             message=f"Configuration updated: {', '.join(updated_settings)}"
         )
         
-    except Exception as e:
+    except ValueError as e:
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to update configuration: {str(e)}"
+            status_code=422,
+            detail=f"Invalid configuration: {str(e)}"
         )
 
 
@@ -135,21 +127,14 @@ async def restart_system(
     
     Gracefully restart system components while maintaining state.
     """
-    try:
-        # In a real implementation, this would trigger a graceful restart
-        await agent_manager.cleanup()
-        await agent_manager.initialize()
-        
-        return BaseResponse(
-            status=ResponseStatus.SUCCESS,
-            message="System restarted successfully"
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to restart system: {str(e)}"
-        )
+    # In a real implementation, this would trigger a graceful restart
+    await agent_manager.cleanup()
+    await agent_manager.initialize()
+    
+    return BaseResponse(
+        status=ResponseStatus.SUCCESS,
+        message="System restarted successfully"
+    )
 
 
 @router.get("/logs")
@@ -160,34 +145,85 @@ async def get_logs(
     """
     Get system logs
     
-    Retrieve recent system logs for debugging and monitoring.
+    Retrieve the last `lines` log entries at or above `level` from the
+    JSON-lines log file in the logs directory.
     """
+    log_path = os.path.join(settings.logs_dir, LOG_FILE_NAME)
+    min_level = logging.getLevelName(level.upper())
+    if not isinstance(min_level, int):
+        min_level = logging.INFO
+    
+    # File reads block, so they run in the threadpool
+    logs = await run_in_threadpool(_read_log_entries, log_path, lines, min_level)
+    
+    return {
+        "status": ResponseStatus.SUCCESS,
+        "message": f"Retrieved {len(logs)} log entries",
+        "logs": logs,
+        "total_logs": len(logs)
+    }
+
+
+def _parse_log_line(line: bytes, min_level: int) -> Optional[Dict[str, Any]]:
+    """Parse one JSON log line, returning None if it is blank, malformed or below min_level"""
+    line = line.strip()
+    if not line:
+        return None
     try:
-        # In a real implementation, this would read from log files
-        logs = [
-            {
-                "timestamp": "2024-01-15T10:30:00Z",
-                "level": "INFO",
-                "message": "System started successfully",
-                "component": "main"
-            },
-            {
-                "timestamp": "2024-01-15T10:30:01Z",
-                "level": "INFO", 
-                "message": "Agent Manager initialized",
-                "component": "agent_manager"
-            }
-        ]
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    
+    entry_level = logging.getLevelName(str(entry.get("level", "INFO")).upper())
+    if isinstance(entry_level, int) and entry_level < min_level:
+        return None
+    return entry
+
+
+def _read_log_entries(path: str, count: int, min_level: int) -> List[Dict[str, Any]]:
+    """_tail_log_entries, reading a missing log file as empty"""
+    if not os.path.isfile(path):
+        return []
+    return _tail_log_entries(path, count, min_level)
+
+
+def _tail_log_entries(path: str, count: int, min_level: int, chunk_size: int = 8192) -> List[Dict[str, Any]]:
+    """Return the last `count` matching entries of a JSON-lines log file
+    
+    The file is read backwards in chunks and reading stops as soon as enough
+    matching entries are found, so cost is bounded by the entries returned
+    rather than by the size of the file.
+    """
+    entries: List[Dict[str, Any]] = []
+    if count <= 0:
+        return entries
+    
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        remainder = b""
         
-        return {
-            "status": ResponseStatus.SUCCESS,
-            "message": f"Retrieved {len(logs)} log entries",
-            "logs": logs[-lines:],  # Return last N lines
-            "total_logs": len(logs)
-        }
+        while pos > 0 and len(entries) < count:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            
+            # The first piece may be the tail of a line that starts in an
+            # earlier chunk, so hold it back until that chunk is read
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                entry = _parse_log_line(line, min_level)
+                if entry is not None:
+                    entries.append(entry)
+                    if len(entries) == count:
+                        break
         
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get logs: {str(e)}"
-        ) 
\ No newline at end of file
+        if pos == 0 and len(entries) < count:
+            entry = _parse_log_line(remainder, min_level)
+            if entry is not None:
+                entries.append(entry)
+    
+    entries.reverse()
+    return entries
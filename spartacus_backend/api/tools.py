@@ -3,7 +3,8 @@ Tools API Router
 Endpoints for tool management and execution
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Body, HTTPException, Depends
+from fastapi.responses import JSONResponse
 from typing import List, Dict, Any
 
 from spartacus_backend.models.requests import ToolExecuteRequest
@@ -12,8 +13,10 @@ from spartacus_backend.models.responses import (
 )
 from spartacus_backend.services.agent_manager import SpartacusAgentManager
 from spartacus_backend.dependencies import get_agent_manager
+from spartacus_backend.api import examples
+from spartacus_backend.api.routing import ErrorHandlingRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorHandlingRoute)
 
 
 @router.get("/list", response_model=ToolListResponse)
@@ -25,26 +28,19 @@ async def list_tools(
     
     Returns a list of all registered tools with their descriptions and parameters.
     """
-    try:
-        tools = await agent_manager.get_available_tools()
-        
-        return ToolListResponse(
-            status=ResponseStatus.SUCCESS,
-            message="Tools retrieved successfully",
-            tools=tools,
-            total_tools=len(tools)
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to retrieve tools: {str(e)}"
-        )
+    tools = agent_manager.get_available_tools()
+    
+    return ToolListResponse(
+        status=ResponseStatus.SUCCESS,
+        message="Tools retrieved successfully",
+        tools=tools,
+        total_tools=len(tools)
+    )
 
 
 @router.post("/execute", response_model=ToolExecuteResponse)
 async def execute_tool(
-    request: ToolExecuteRequest,
+    request: ToolExecuteRequest = Body(openapi_examples=examples.TOOL_EXECUTE_REQUEST),
     agent_manager: SpartacusAgentManager = Depends(get_agent_manager)
 ):
     """
@@ -59,7 +55,8 @@ async def execute_tool(
             context=request.context
         )
         
-        return ToolExecuteResponse(
+        # Every field comes from the agent manager, so skip re-validating it
+        return ToolExecuteResponse.model_construct(
             status=ResponseStatus.SUCCESS if result["success"] else ResponseStatus.ERROR,
             message="Tool executed successfully" if result["success"] else "Tool execution failed",
             tool_name=result["tool_name"],
@@ -70,11 +67,6 @@ async def execute_tool(
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Tool execution failed: {str(e)}"
-        )
 
 
 @router.get("/{tool_name}/info")
@@ -87,26 +79,17 @@ async def get_tool_info(
     
     Returns detailed information including parameters schema and usage examples.
     """
-    try:
-        if tool_name not in agent_manager.tools:
-            raise HTTPException(status_code=404, detail="Tool not found")
-        
-        tool = agent_manager.tools[tool_name]
-        
-        return {
-            "status": ResponseStatus.SUCCESS,
-            "tool_name": tool_name,
-            "description": getattr(tool, 'description', 'Tool description'),
-            "parameters": {},  # Would extract from tool schema
-            "category": "general",
-            "enabled": True,
-            "usage_examples": []  # Could be added based on tool documentation
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get tool info: {str(e)}"
-        ) 
\ No newline at end of file
+    tool = agent_manager.tools.get(tool_name)
+    if tool is None:
+        return JSONResponse(status_code=404, content={"detail": "Tool not found"})
+    
+    return {
+        "status": ResponseStatus.SUCCESS,
+        "tool_name": tool_name,
+        "description": getattr(tool, 'description', 'Tool description'),
+        "parameters": {},  # Would extract from tool schema
+        "category": "general",
+        "enabled": True,
+        "usage_examples": []  # Could be added based on tool documentation
+    }
+ 
\ No newline at end of file
@@ -2,85 +2,199 @@
 Configuration settings for Spartacus Backend
 """
 
-from pydantic_settings import BaseSettings
-from pydantic import Field, ConfigDict
-from typing import List
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional
+from functools import lru_cache
+import json
 import os
-from dotenv import load_dotenv
+import re
 
-# Load environment variables from .env file
-load_dotenv()
+ENV_FILE = ".env"
 
-class Settings(BaseSettings):
-    """Application settings"""
+# JSON-lines log file written by the backend, relative to Settings.logs_dir
+LOG_FILE_NAME = "spartacus.log"
+
+# KEY=value lines of a .env file, optionally prefixed with "export"
+_ENV_LINE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off", "n", "f"})
+
+
+@lru_cache(maxsize=4)
+def read_env_file(path: str = ENV_FILE) -> Dict[str, str]:
+    """Parse a .env file into a dict, once per process
+
+    Blank lines and # comments are skipped and matching surrounding quotes
+    are stripped from values. A missing file reads as empty.
+    """
+    values: Dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return values
     
-    # Use ConfigDict for Pydantic v2
-    model_config = ConfigDict(
-        env_file=".env",
-        case_sensitive=False,
-        extra="allow"  # Allow extra fields from .env
-    )
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        match = _ENV_LINE.match(line)
+        if match is None:
+            continue
+        key, value = match.groups()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key] = value
+    return values
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean: {value!r}")
+
+
+def _parse_int(value: Any) -> int:
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"invalid integer: {value!r}")
+    return int(value)
+
+
+def _parse_str_list(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"expected a list of strings: {value!r}")
+    return value
+
+
+def _parse_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"expected a string: {value!r}")
+    return value
+
+
+# Converts a raw environment string (or an already-typed value) to each field type
+_PARSERS = {
+    str: _parse_str,
+    int: _parse_int,
+    float: float,
+    bool: _parse_bool,
+    List[str]: _parse_str_list,
+}
+
+
+@dataclass(slots=True)
+class Settings:
+    """Application settings
+
+    Each field is read from the environment variable of the same name
+    (case-insensitive), falling back to .env and then to the default.
+    Not frozen: /api/system/config updates fields at runtime.
+    """
     
     # Server configuration
-    host: str = Field(default="127.0.0.1", description="Server host")
-    port: int = Field(default=8000, description="Server port")
-    reload: bool = Field(default=False, description="Auto-reload on code changes")
-    log_level: str = Field(default="INFO", description="Logging level")
+    host: str = "127.0.0.1"
+    port: int = 8000
+    reload: bool = False
+    log_level: str = "INFO"
     
     # CORS settings
-    cors_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://127.0.0.1:3000"],
-        description="Allowed CORS origins"
+    cors_origins: List[str] = field(
+        default_factory=lambda: ["http://localhost:3000", "http://127.0.0.1:3000"]
     )
     
     # Agent configuration
-    max_agents: int = Field(default=10, description="Maximum number of concurrent agents")
-    agent_timeout: int = Field(default=300, description="Agent timeout in seconds")
+    max_agents: int = 10
+    agent_timeout: int = 300
+    batch_concurrency: int = 8  # concurrent runs per run_agent_batch call
     
     # Chat configuration
-    max_chat_history: int = Field(default=100, description="Maximum chat history length")
-    enable_streaming: bool = Field(default=True, description="Enable WebSocket streaming")
+    max_chat_history: int = 100
+    max_active_sessions: int = 10000  # sessions whose context is kept, least recently used evicted
+    enable_streaming: bool = True
     
     # LLM configuration
-    default_model: str = Field(default="gpt-4", description="Default LLM model")
-    max_tokens: int = Field(default=4000, description="Maximum tokens per request")
-    temperature: float = Field(default=0.7, description="LLM temperature")
+    default_model: str = "gpt-4"
+    max_tokens: int = 4000
+    temperature: float = 0.7
     
     # Azure OpenAI configuration
-    azure_openai_endpoint: str = Field(default="", description="Azure OpenAI endpoint")
-    azure_openai_model: str = Field(default="gpt-4", description="Azure OpenAI model")
-    azure_openai_api_version: str = Field(default="2024-10-21", description="Azure OpenAI API version")
-    azure_openai_api_key: str = Field(default="", description="Azure OpenAI API key")
+    azure_openai_endpoint: str = ""
+    azure_openai_model: str = "gpt-4"
+    azure_openai_api_version: str = "2024-10-21"
+    azure_openai_api_key: str = ""
     
     # Additional Azure OpenAI endpoints
-    azure_openai_endpoint_us_gpt4o_mini: str = Field(default="", description="Azure OpenAI US endpoint for GPT-4o mini")
-    azure_openai_api_version_us_gpt4o_mini: str = Field(default="2023-03-15-preview", description="Azure OpenAI US API version for GPT-4o mini")
-    azure_openai_model_us_gpt4o_mini: str = Field(default="gpt-4o-mini", description="Azure OpenAI US model for GPT-4o mini")
-    azure_openai_key_us_gpt4o_mini: str = Field(default="", description="Azure OpenAI US API key for GPT-4o mini")
+    azure_openai_endpoint_us_gpt4o_mini: str = ""
+    azure_openai_api_version_us_gpt4o_mini: str = "2023-03-15-preview"
+    azure_openai_model_us_gpt4o_mini: str = "gpt-4o-mini"
+    azure_openai_key_us_gpt4o_mini: str = ""
     
     # OpenAI configuration
-    openai_api_key: str = Field(default="", description="OpenAI API key")
+    openai_api_key: str = ""
     
     # Other service tokens
-    hf_access_token_summarizer: str = Field(default="", description="HuggingFace access token for summarizer")
-    logfire_token: str = Field(default="", description="Logfire token")
+    hf_access_token_summarizer: str = ""
+    logfire_token: str = ""
     
     # Paths
-    data_dir: str = Field(default="./data", description="Data directory")
-    logs_dir: str = Field(default="./logs", description="Logs directory")
+    data_dir: str = "./data"
+    logs_dir: str = "./logs"
+
+    SPARTACUS_ENV: str = "development"
+
+    @classmethod
+    def field_names(cls) -> frozenset:
+        """Names of all settings fields"""
+        return frozenset(f.name for f in fields(cls))
+    
+    @classmethod
+    def parse_values(cls, values: Mapping[str, Any]) -> Dict[str, Any]:
+        """Convert raw values for known fields to their field types
 
-    SPARTACUS_ENV: str = Field(default="development", description="Environment")
+        Unknown keys are ignored. Raises ValueError naming the field if a
+        value cannot be converted.
+        """
+        parsed = {}
+        for f in fields(cls):
+            if f.name in values:
+                try:
+                    parsed[f.name] = _PARSERS[f.type](values[f.name])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"{f.name}: {e}") from None
+        return parsed
+    
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None, env_file: str = ENV_FILE) -> "Settings":
+        """Build settings from the environment, then .env, then the defaults"""
+        if environ is None:
+            environ = os.environ
+        # Environment variables win over .env; names match case-insensitively
+        raw = {key.lower(): value for key, value in read_env_file(env_file).items()}
+        raw.update((key.lower(), value) for key, value in environ.items())
+        values = {name: raw[name.lower()] for name in cls.field_names() if name.lower() in raw}
+        return cls(**cls.parse_values(values))
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance with lazy initialization"""
-    return Settings()
+    """Get the settings instance, parsing the environment and .env only once"""
+    return Settings.from_env()
 
 
 # For backwards compatibility, create a default instance
 # but move it to a function to avoid import-time execution issues
+@lru_cache(maxsize=1)
 def get_default_settings() -> Settings:
-    """Get default settings instance"""
+    """Get default settings instance, creating its directories on first use"""
     settings = get_settings()
     
     # Ensure directories exist
@@ -90,5 +204,13 @@ def get_default_settings() -> Settings:
     return settings
 
 
-# Global settings instance for backwards compatibility
-settings = get_default_settings() 
\ No newline at end of file
+def __getattr__(name: str):
+    """Build the global `settings` instance on first access (PEP 562)
+
+    Kept for backwards compatibility with `from ... import settings`, without
+    parsing the environment or creating directories at import time.
+    """
+    if name == "settings":
+        globals()["settings"] = get_default_settings()
+        return globals()["settings"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
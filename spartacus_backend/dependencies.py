@@ -3,21 +3,42 @@ FastAPI Dependencies
 Provides shared dependencies for the API endpoints
 """
 
-from fastapi import HTTPException
-from spartacus_backend.services.agent_manager import SpartacusAgentManager
+from typing import TYPE_CHECKING
 
-# Global agent manager instance will be set by main.py
-agent_manager: SpartacusAgentManager = None
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
+if TYPE_CHECKING:
+    from spartacus_backend.services.agent_manager import SpartacusAgentManager
 
-def set_agent_manager(manager: SpartacusAgentManager):
-    """Set the global agent manager instance"""
-    global agent_manager
-    agent_manager = manager
 
+async def get_agent_manager(request: Request) -> "SpartacusAgentManager":
+    """Get the agent manager stored on app.state at startup
 
-def get_agent_manager() -> SpartacusAgentManager:
-    """Get the global agent manager instance"""
-    if agent_manager is None:
-        raise HTTPException(status_code=500, detail="Agent manager not initialized")
-    return agent_manager 
\ No newline at end of file
+    The lifespan handler sets it before the app accepts requests, so no
+    None check is needed. Declared async so FastAPI resolves it inline on
+    the event loop rather than dispatching it to the threadpool as it does
+    for sync dependencies.
+    """
+    return request.app.state.agent_manager
+
+
+def json_body(adapter: TypeAdapter):
+    """Build a dependency that validates the raw JSON request body with adapter
+
+    pydantic-core parses and validates the bytes in a single pass instead of
+    FastAPI decoding them to a dict first. Errors are reported as the usual
+    422 response, with locations under "body" as FastAPI does.
+    """
+    async def dependency(request: Request):
+        body = await request.body()
+        try:
+            return adapter.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+                body=body
+            )
+    
+    return dependency
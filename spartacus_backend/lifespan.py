@@ -0,0 +1,53 @@
+"""
+Lifespan composition
+Lets each backend subsystem register its own startup/shutdown context
+"""
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncContextManager, Callable, List
+
+from fastapi import FastAPI
+
+LifespanFactory = Callable[[FastAPI], AsyncContextManager[None]]
+
+
+class LifespanRegistry:
+    """Collects per-subsystem lifespan context managers
+
+    Subsystems register a factory taking the app and returning an async
+    context manager. At startup every context is entered concurrently, so
+    independent resources do not wait for each other. At shutdown they exit
+    in reverse registration order.
+    """
+
+    def __init__(self):
+        self._factories: List[LifespanFactory] = []
+
+    def register(self, factory: LifespanFactory) -> LifespanFactory:
+        """Register a lifespan factory; usable as a decorator"""
+        self._factories.append(factory)
+        return factory
+
+    @asynccontextmanager
+    async def run(self, app: FastAPI):
+        """Enter every registered context for the lifetime of the app"""
+        async with AsyncExitStack() as stack:
+            managers = [factory(app) for factory in self._factories]
+            results = await asyncio.gather(
+                *(manager.__aenter__() for manager in managers),
+                return_exceptions=True
+            )
+
+            # Push exits for every context that started, even if another
+            # failed, so the stack still shuts those down on the way out
+            errors = []
+            for manager, result in zip(managers, results):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                else:
+                    stack.push_async_exit(manager)
+            if errors:
+                raise errors[0]
+
+            yield
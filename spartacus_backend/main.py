@@ -5,43 +5,102 @@ Main entry point that exposes the agentic_lib as REST API
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+import logging
+import os
 import uvicorn
 from contextlib import asynccontextmanager
 
-from spartacus_backend.api.chat import router as chat_router
-from spartacus_backend.api.agents import router as agents_router
-from spartacus_backend.api.tools import router as tools_router
-from spartacus_backend.api.system import router as system_router
-from spartacus_backend.services.agent_manager import SpartacusAgentManager
-from spartacus_backend.config.settings import settings
-import spartacus_backend.dependencies as dependencies
+from spartacus_backend.config.settings import LOG_FILE_NAME, settings
+from spartacus_backend.lifespan import LifespanRegistry
+
+# Encode responses with orjson when it is installed. Newer FastAPI releases
+# serialize response models straight to JSON bytes through pydantic, which
+# is faster still, and mark ORJSONResponse deprecated; keep JSONResponse there.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    if getattr(ORJSONResponse, "__deprecated__", None):
+        DEFAULT_RESPONSE_CLASS = JSONResponse
+    else:
+        DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
+
+def _register_routers(app: FastAPI):
+    """Import and mount the API routers
+    
+    Called from the lifespan handler so importing this module stays cheap;
+    the routers pull in the agent manager and the whole model tree.
+    """
+    if getattr(app.state, "routers_registered", False):
+        return
+    
+    from spartacus_backend.api.chat import router as chat_router
+    from spartacus_backend.api.agents import router as agents_router
+    from spartacus_backend.api.tools import router as tools_router
+    from spartacus_backend.api.system import router as system_router
+    
+    app.include_router(chat_router, prefix="/api/chat", tags=["chat"])
+    app.include_router(agents_router, prefix="/api/agents", tags=["agents"])
+    app.include_router(tools_router, prefix="/api/tools", tags=["tools"])
+    app.include_router(system_router, prefix="/api/system", tags=["system"])
+    app.state.routers_registered = True
 
 
-# Global agent manager instance
-agent_manager: SpartacusAgentManager = None
+# Subsystems register their startup/shutdown context here
+lifespans = LifespanRegistry()
 
 
+@lifespans.register
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan handler"""
-    global agent_manager
-    
-    # Startup
-    print("🚀 Starting Spartacus Backend...")
-    agent_manager = SpartacusAgentManager()
-    await agent_manager.initialize()
+async def log_file_lifespan(app: FastAPI):
+    """Write the backend logs to the file served by /api/system/logs
     
-    # Set the agent manager in dependencies
-    dependencies.set_agent_manager(agent_manager)
+    Registered first so it is attached before the other subsystems log.
+    """
+    from spartacus_services.logger import add_file_handler
+    level = logging.getLevelName(settings.log_level.upper())
+    handler = add_file_handler(
+        os.path.join(settings.logs_dir, LOG_FILE_NAME),
+        level=level if isinstance(level, int) else logging.INFO
+    )
     
+    try:
+        yield
+    finally:
+        logging.getLogger().removeHandler(handler)
+        handler.close()
+
+
+@lifespans.register
+@asynccontextmanager
+async def agent_manager_lifespan(app: FastAPI):
+    """Create the agent manager at startup and clean it up at shutdown"""
+    from spartacus_backend.services.agent_manager import SpartacusAgentManager
+    app.state.agent_manager = agent_manager = SpartacusAgentManager()
+    await agent_manager.initialize()
     print("✅ Agent Manager initialized")
     
-    yield
-    
-    # Shutdown
-    print("🛑 Shutting down Spartacus Backend...")
-    if agent_manager:
+    try:
+        yield
+    finally:
         await agent_manager.cleanup()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan handler"""
+    # Startup
+    print("🚀 Starting Spartacus Backend...")
+    _register_routers(app)
+    
+    async with lifespans.run(app):
+        yield
+        
+        # Shutdown
+        print("🛑 Shutting down Spartacus Backend...")
     print("✅ Cleanup completed")
 
 
@@ -50,24 +109,19 @@ app = FastAPI(
     title="Spartacus Desktop Backend",
     description="FastAPI backend for Spartacus Desktop - Claude Desktop alternative",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS
 )
 
 # CORS middleware for frontend communication
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],  # React frontend
+    allow_origins=tuple(settings.cors_origins),  # React frontend
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE"),
+    allow_headers=("Content-Type", "Authorization"),
 )
 
-# Include API routers
-app.include_router(chat_router, prefix="/api/chat", tags=["chat"])
-app.include_router(agents_router, prefix="/api/agents", tags=["agents"])
-app.include_router(tools_router, prefix="/api/tools", tags=["tools"])
-app.include_router(system_router, prefix="/api/system", tags=["system"])
-
 
 @app.get("/")
 async def root():
@@ -85,7 +139,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "agent_manager": agent_manager is not None
+        "agent_manager": getattr(app.state, "agent_manager", None) is not None
     }
 
 
@@ -2,8 +2,10 @@
 Pydantic response models for Spartacus Backend API
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+import time
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -16,148 +18,116 @@ class ResponseStatus(str, Enum):
     PARTIAL = "partial"
 
 
+# Field type for response statuses; pydantic-core matches a Literal directly
+# instead of going through the enum. ResponseStatus stays for application code.
+ResponseStatusName = Literal["success", "error", "processing", "partial"]
+
+
 class BaseResponse(BaseModel):
     """Base response model"""
-    status: ResponseStatus = Field(..., description="Response status")
-    message: Optional[str] = Field(default=None, description="Response message")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
+    status: ResponseStatusName
+    message: Optional[str] = None
+    timestamp_ns: int = Field(default_factory=time.time_ns)  # epoch nanoseconds
 
 
 class AgentRunResponse(BaseResponse):
     """Response from agent execution"""
-    agent_id: str = Field(..., description="Agent execution ID")
-    agent_type: str = Field(..., description="Type of agent that was run")
-    response: str = Field(..., description="Agent's response")
-    iterations: int = Field(..., description="Number of iterations performed")
-    execution_time: float = Field(..., description="Execution time in seconds")
-    tools_used: List[str] = Field(default=[], description="Tools used during execution")
-    context: Optional[Dict[str, Any]] = Field(default=None, description="Updated context")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "success",
-                "message": "Agent execution completed",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "agent_id": "agent-run-123",
-                "agent_type": "analysis",
-                "response": "Based on the data analysis...",
-                "iterations": 3,
-                "execution_time": 12.5,
-                "tools_used": ["python_executor", "data_analyzer"],
-                "context": {"analysis_result": "completed"}
-            }
-        }
+    agent_id: str
+    agent_type: str
+    response: str
+    iterations: int
+    execution_time: float  # seconds
+    tools_used: Tuple[str, ...] = ()
+    context: Optional[Dict[str, Any]] = None
 
 
 class ChatMessage(BaseModel):
     """Chat message model"""
-    id: str = Field(..., description="Message ID")
-    role: str = Field(..., description="Message role (user/assistant)")
-    content: str = Field(..., description="Message content")
-    timestamp: datetime = Field(..., description="Message timestamp")
-    agent_type: Optional[str] = Field(default=None, description="Agent type if from agent")
-    tools_used: List[str] = Field(default=[], description="Tools used in this message")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    id: str
+    role: str  # user/assistant
+    content: str
+    timestamp: datetime
+    agent_type: Optional[str] = None
+    tools_used: Tuple[str, ...] = ()
 
 
 class ChatResponse(BaseResponse):
     """Response for chat operations"""
-    session_id: str = Field(..., description="Chat session ID")
-    message: ChatMessage = Field(..., description="The response message")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "success",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "session_id": "chat-123",
-                "message": {
-                    "id": "msg-456",
-                    "role": "assistant",
-                    "content": "Hello! How can I help you?",
-                    "timestamp": "2024-01-15T10:30:00Z",
-                    "agent_type": "default",
-                    "tools_used": []
-                }
-            }
-        }
+    session_id: str
+    message: ChatMessage
 
 
 class ChatHistoryResponse(BaseResponse):
     """Response for chat history"""
-    session_id: str = Field(..., description="Chat session ID")
-    messages: List[ChatMessage] = Field(..., description="Chat messages")
-    total_messages: int = Field(..., description="Total number of messages")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": "success",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "session_id": "chat-123",
-                "messages": [],
-                "total_messages": 0
-            }
-        }
+    session_id: str
+    messages: List[ChatMessage]
+    total_messages: int
 
 
 class AgentInfo(BaseModel):
     """Agent information model"""
-    id: str = Field(..., description="Agent ID")
-    name: str = Field(..., description="Agent name")
-    description: str = Field(..., description="Agent description")
-    type: str = Field(..., description="Agent type")
-    tools: List[str] = Field(..., description="Available tools")
-    model: str = Field(..., description="LLM model")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    active: bool = Field(..., description="Whether agent is active")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    id: str
+    name: str
+    description: str
+    type: str
+    tools: Tuple[str, ...]
+    model: str
+    created_at: datetime
+    active: bool
 
 
 class AgentListResponse(BaseResponse):
     """Response for listing agents"""
-    agents: List[AgentInfo] = Field(..., description="List of available agents")
-    total_agents: int = Field(..., description="Total number of agents")
+    agents: List[AgentInfo]
+    total_agents: int
 
 
 class ToolInfo(BaseModel):
     """Tool information model"""
-    name: str = Field(..., description="Tool name")
-    description: str = Field(..., description="Tool description")
-    parameters: Dict[str, Any] = Field(..., description="Tool parameters schema")
-    category: str = Field(..., description="Tool category")
-    enabled: bool = Field(..., description="Whether tool is enabled")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    name: str
+    description: str
+    parameters: Dict[str, Any]  # JSON schema
+    category: str
+    enabled: bool
 
 
 class ToolListResponse(BaseResponse):
     """Response for listing tools"""
-    tools: List[ToolInfo] = Field(..., description="List of available tools")
-    total_tools: int = Field(..., description="Total number of tools")
+    tools: List[ToolInfo]
+    total_tools: int
 
 
 class ToolExecuteResponse(BaseResponse):
     """Response from tool execution"""
-    tool_name: str = Field(..., description="Executed tool name")
-    result: Any = Field(..., description="Tool execution result")
-    execution_time: float = Field(..., description="Execution time in seconds")
-    success: bool = Field(..., description="Whether execution was successful")
+    tool_name: str
+    result: Any
+    execution_time: float  # seconds
+    success: bool
 
 
 class SystemStatusResponse(BaseResponse):
     """System status response"""
-    version: str = Field(..., description="Application version")
-    uptime: float = Field(..., description="System uptime in seconds")
-    active_agents: int = Field(..., description="Number of active agents")
-    active_sessions: int = Field(..., description="Number of active chat sessions")
-    memory_usage: float = Field(..., description="Memory usage percentage")
-    cpu_usage: float = Field(..., description="CPU usage percentage")
+    version: str
+    uptime: float  # seconds
+    active_agents: int
+    active_sessions: int
+    memory_usage: float  # percent
+    cpu_usage: float  # percent
 
 
 class ErrorResponse(BaseResponse):
     """Error response model"""
-    error_code: str = Field(..., description="Error code")
-    error_details: Optional[Dict[str, Any]] = Field(default=None, description="Error details")
+    error_code: str
+    error_details: Optional[Dict[str, Any]] = None
     
     def __init__(self, **data):
         if "status" not in data:
             data["status"] = ResponseStatus.ERROR
-        super().__init__(**data) 
\ No newline at end of file
+        super().__init__(**data)
+
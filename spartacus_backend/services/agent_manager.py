@@ -4,10 +4,18 @@ Manages agent lifecycle, execution, and state
 """
 
 import asyncio
-import uuid
+import copy
+import hashlib
+import itertools
+import json
+import secrets
 import time
-from typing import Dict, Any, Optional, List, Union
-from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Callable, Deque, Optional, List, Set, Tuple, Union
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from enum import Enum
 
 # Import agentic_lib components
@@ -30,6 +38,13 @@ except ImportError as e:
     print(f"Gmail tools not available: {e}")
     GMAIL_TOOLS_AVAILABLE = False
 
+# psutil is only needed for the resource figures in the system status
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 from spartacus_backend.models.requests import AgentType
 from spartacus_backend.models.responses import AgentInfo, ToolInfo, AgentListResponse, ResponseStatus
 from spartacus_backend.config.settings import settings
@@ -37,39 +52,184 @@ from spartacus_backend.services.mcp_gmail_client import GmailMCPClient
 
 logger = get_logger(__name__)
 
+# Agent ids are a per-process random nonce plus a counter: unique within the
+# process without reading the OS random source for every agent
+_AGENT_NONCE = secrets.token_hex(3)
+_AGENT_COUNTER = itertools.count()
+
+# Most agents of one type that can be borrowed at once; the pool creates
+# instances on demand up to this size
+AGENT_POOL_MAX_SIZE = 50
+
+# Seconds between resource samples for the system status; sampled less
+# often while no session is active
+STATS_INTERVAL = 5.0
+STATS_IDLE_INTERVAL = 30.0
+
+# Most concurrent direct executions per tool, to stay under provider rate
+# limits; tools not listed are unbounded
+TOOL_CONCURRENCY = {
+    "gmail_send": 2,
+    "gmail_search": 4,
+    "gmail_read": 4
+}
+_UNLIMITED = nullcontext()
+
+# Read-only tools whose direct executions are cached by their parameters;
+# entries expire so new mail still shows up
+MEMOIZED_TOOLS = frozenset({"gmail_search", "gmail_read"})
+TOOL_CACHE_SIZE = 512
+TOOL_CACHE_TTL = 60.0
+
+# Worker threads shared by blocking calls and cpu_bound tools run off the event loop
+BLOCKING_POOL_WORKERS = 2
+
+
+# Cached responses of stateless agent runs on agents sampling at temperature 0
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_TTL = 300.0
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _new_context() -> Dict[str, Any]:
+    """Empty conversation context for an agent or session"""
+    return {
+        "messages": [],
+        "session_data": {}
+    }
+
+
+@dataclass(slots=True)
+class RunResult:
+    """Outcome of one agent run"""
+    agent_id: str
+    agent_type: str
+    response: str
+    iterations: int
+    execution_time: float  # seconds
+    tools_used: Tuple[str, ...]
+    context: Dict[str, Any]
+    cache_hit: bool = False
+
 
 class AgentInstance:
     """Individual agent instance with its state"""
     
-    def __init__(self, agent_id: str, agent_type: str, agent):
+    __slots__ = (
+        "id", "type", "pool", "agent", "created_at", "_created_ns", "last_used_ns",
+        "active", "context", "_info_template"
+    )
+    
+    def __init__(self, agent_id: str, agent_type: str, agent, pool: Optional[str] = None):
         self.id = agent_id
         self.type = agent_type
+        self.pool = pool  # key of the agent pool it belongs to, see _pool_key
         self.agent = agent
         self.created_at = datetime.now()
-        self.last_used = datetime.now()
+        # Monotonic clock readings; last_used converts back to wall time on demand
+        self._created_ns = self.last_used_ns = time.monotonic_ns()
         self.active = True
         # Create a simple mock context instead of using Context
-        self.context = {
-            "messages": [],
-            "session_data": {}
+        self.context = _new_context()
+        # AgentInfo fields that never change, built once for listings
+        self._info_template = {
+            "id": agent_id,
+            "name": f"{agent_type.title()} Agent",
+            "description": f"Agent of type {agent_type}",
+            "type": agent_type,
+            "model": settings.default_model,
+            "created_at": self.created_at
         }
     
     def update_last_used(self):
         """Update last used timestamp"""
-        self.last_used = datetime.now()
+        self.last_used_ns = time.monotonic_ns()
+    
+    @property
+    def last_used(self) -> datetime:
+        """Wall-clock time of the last use, for display"""
+        return self.created_at + timedelta(microseconds=(self.last_used_ns - self._created_ns) // 1000)
 
 
 class SpartacusAgentManager:
     """Manages agentic_lib agents and their execution"""
     
     def __init__(self):
-        self.agents: Dict[str, AgentInstance] = {}
-        self.active_sessions: Dict[str, str] = {}  # session_id -> agent_id
+        self.agents: Dict[str, AgentInstance] = {}  # agents created through create_agent
+        # Session state, least recently used first; at most
+        # settings.max_active_sessions sessions are kept
+        self.active_sessions: "OrderedDict[str, str]" = OrderedDict()  # session_id -> agent_id
+        self.agent_to_sessions: Dict[str, Set[str]] = defaultdict(set)  # agent_id -> session_ids
+        self.session_contexts: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # session_id -> conversation context
+        
+        # Agent pools, one per agent configuration (see _pool_key): idle
+        # instances, ids of borrowed ones, a semaphore bounding borrows and
+        # the create_agent arguments used to add instances when none is idle
+        self._idle: Dict[str, Deque[AgentInstance]] = defaultdict(deque)
+        self._in_use: Dict[str, Set[str]] = defaultdict(set)
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+        self._agent_configs: Dict[str, Dict[str, Any]] = {}
+        self._agent_templates: Dict[str, Tuple[Dict[str, Tool], str]] = {}  # see _agent_template
+        self._type_pools: Dict[str, str] = {}  # agent type -> pool serving its runs
+        # Extra instances the pools created to serve concurrent runs; kept
+        # out of self.agents so they are not listed as agents
+        self._pool_clones: Dict[str, AgentInstance] = {}
+        self.pool_hits = 0
+        self.total_borrows = 0
+        
+        # Responses of deterministic agent runs, see _response_cache_key
+        self._resp_cache = _TTLCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+        self._inflight: Dict[Tuple[str, str, int], asyncio.Future] = {}  # cache key -> result of the running call
         self.tools: Dict[str, Tool] = {}
+        self._tools_tuple: Tuple[str, ...] = ()  # tool names, refreshed by _load_tools
+        self._tool_sems: Dict[str, asyncio.Semaphore] = {}  # tool name -> TOOL_CONCURRENCY bound
+        self._tool_cache = _TTLCache(TOOL_CACHE_SIZE, TOOL_CACHE_TTL)  # results of MEMOIZED_TOOLS
+        
+        # Listings built on first request; reset whenever agents or tools change
+        self._agents_info: Optional[List[AgentInfo]] = None
+        self._tools_info: Optional[List[ToolInfo]] = None
         self.llm_client: Optional[AzureOpenAIClient] = None
         self.gmail_client: Optional[GmailMCPClient] = None
         self.start_time = time.time()
         
+        # Resource usage sampled in the background for get_system_status
+        self._cached_stats: Dict[str, float] = {"memory_usage": 0.0, "cpu_usage": 0.0}
+        self._stats_task: Optional[asyncio.Task] = None
+        
+        # Created on first use, see _get_blocking_pool
+        self._blocking_pool: Optional[ThreadPoolExecutor] = None
+        
     async def initialize(self):
         """Initialize the agent manager"""
         logger.info("Initializing SpartacusAgentManager...")
@@ -86,6 +246,9 @@ class SpartacusAgentManager:
             logger.info("✅ LLM client initialized and tested successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize LLM client: {e}")
+            if self.llm_client is not None:
+                await self.llm_client.aclose()
+                self.llm_client = None
             logger.error("❌ Cannot start Spartacus without LLM client connection")
             raise RuntimeError(f"Failed to initialize Azure OpenAI client: {e}")
         
@@ -104,6 +267,9 @@ class SpartacusAgentManager:
         # Create default agent types
         await self._create_default_agents()
         
+        if PSUTIL_AVAILABLE and self._stats_task is None:
+            self._stats_task = asyncio.create_task(self._sample_stats_loop())
+        
         logger.info(f"✅ Agent Manager initialized with {len(self.agents)} agents and {len(self.tools)} tools")
         logger.info(f"🤖 LLM Client status: REAL Azure OpenAI")
         
@@ -116,9 +282,26 @@ class SpartacusAgentManager:
         logger.info("Cleaning up SpartacusAgentManager...")
         
         # Stop all active agents
-        for agent_instance in self.agents.values():
+        for agent_instance in itertools.chain(self.agents.values(), self._pool_clones.values()):
             agent_instance.active = False
         
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            try:
+                await self._stats_task
+            except asyncio.CancelledError:
+                pass
+            self._stats_task = None
+        
+        if self._blocking_pool is not None:
+            self._blocking_pool.shutdown(wait=False, cancel_futures=True)
+            self._blocking_pool = None
+        
+        # Close the LLM client's pooled connections
+        if self.llm_client is not None:
+            await self.llm_client.aclose()
+            self.llm_client = None
+        
         if self.gmail_client:
             try:
                 await self.gmail_client.stop_server()
@@ -127,7 +310,18 @@ class SpartacusAgentManager:
                 logger.error(f"Error stopping Gmail MCP server: {e}")
         
         self.agents.clear()
+        self._pool_clones.clear()
         self.active_sessions.clear()
+        self.agent_to_sessions.clear()
+        self.session_contexts.clear()
+        self._resp_cache.clear()
+        self._tool_cache.clear()
+        # Semaphores and in-use sets stay: agents still borrowed release into them
+        self._idle.clear()
+        self._agent_configs.clear()
+        self._agent_templates.clear()
+        self._type_pools.clear()
+        self._agents_info = None
         
         logger.info("✅ Cleanup completed")
     
@@ -154,6 +348,21 @@ class SpartacusAgentManager:
             logger.error(f"Failed to load tools: {e}")
             # Only load essential tools
             self.tools = {"final_answer": final_answer_tool}
+        
+        # Shared by every AgentInfo until the tools change again
+        self._tools_tuple = tuple(self.tools)
+        self._tools_info = None
+        self._agents_info = None
+        self._agent_templates.clear()
+        self._tool_sems = {
+            name: asyncio.Semaphore(limit)
+            for name, limit in TOOL_CONCURRENCY.items()
+            if name in self.tools
+        }
+        # CPU-bound tools run in the manager's worker pool, shut down in cleanup
+        for tool in self.tools.values():
+            if tool.cpu_bound:
+                tool.executor = self._get_blocking_pool()
     
     async def _create_default_agents(self):
         """Create default agent types"""
@@ -211,12 +420,14 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
                 "tools": ["gmail_send", "gmail_search", "gmail_read", "final_answer"]
             }
         
-        for agent_type, config in default_configs.items():
-            agent_id = await self.create_agent(
-                agent_type=agent_type.value if hasattr(agent_type, 'value') else agent_type,
-                **config
-            )
-            logger.info(f"Created default agent: {agent_type.value if hasattr(agent_type, 'value') else agent_type} ({agent_id})")
+        # The agents are independent, so create them concurrently
+        type_names = [getattr(agent_type, "value", agent_type) for agent_type in default_configs]
+        agent_ids = await asyncio.gather(*(
+            self.create_agent(agent_type=type_name, **config)
+            for type_name, config in zip(type_names, default_configs.values())
+        ))
+        for type_name, agent_id in zip(type_names, agent_ids):
+            logger.info(f"Created default agent: {type_name} ({agent_id})")
     
     async def create_agent(
         self,
@@ -228,14 +439,70 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
         model: Optional[str] = None,
         temperature: Optional[float] = None
     ) -> str:
-        """Create a new agent instance"""
-        agent_id = f"agent-{uuid.uuid4().hex[:8]}"
+        """Create a new agent instance and add it to the pool for its configuration
+        
+        Runs of agent_type are served by the pool of the first configuration
+        registered for the type; agents created with another configuration
+        keep their own pool and never serve them.
+        """
+        config = {
+            "name": name,
+            "description": description,
+            "instructions": instructions,
+            "tools": tools,
+            "model": model,
+            "temperature": temperature
+        }
+        pool = self._pool_key(agent_type, config)
+        self._agent_configs.setdefault(pool, config)
+        agent_instance = self._new_agent_instance(agent_type, pool)
+        self.agents[agent_instance.id] = agent_instance
+        self._agents_info = None
+        
+        self._type_pools.setdefault(agent_type, pool)
+        self._idle[pool].append(agent_instance)
+        return agent_instance.id
+    
+    @staticmethod
+    def _pool_key(agent_type: str, config: Dict[str, Any]) -> str:
+        """Key of the pool for agents of agent_type created with config"""
+        digest = hashlib.blake2b(json.dumps(config, sort_keys=True).encode(), digest_size=8).hexdigest()
+        return f"{agent_type}:{digest}"
+    
+    def _build_template(
+        self,
+        name: str,
+        instructions: str,
+        tools: List[str]
+    ) -> Tuple[Dict[str, Tool], str]:
+        """Tools and system prompt for an agent configuration"""
+        # Filter tools to only include available ones
+        agent_tools = {tool_name: tool for tool_name, tool in self.tools.items() if tool_name in tools}
+        system_prompt = f"You are a {name}. {instructions}\n\nAvailable tools: {', '.join(agent_tools.keys())}"
+        return agent_tools, system_prompt
+    
+    def _agent_template(self, pool: str) -> Tuple[Dict[str, Tool], str]:
+        """Tools and system prompt of the configuration of a pool
+        
+        Built once per pool and shared by every agent in it, until the tools
+        are reloaded.
+        """
+        template = self._agent_templates.get(pool)
+        if template is None:
+            config = self._agent_configs[pool]
+            template = self._agent_templates[pool] = self._build_template(
+                config["name"], config["instructions"], config["tools"]
+            )
+        return template
+    
+    def _new_agent_instance(self, agent_type: str, pool: str) -> AgentInstance:
+        """Build an agent instance with the configuration of pool; the caller registers it"""
+        agent_id = f"agent-{_AGENT_NONCE}{next(_AGENT_COUNTER):05x}"
+        config = self._agent_configs[pool]
+        name = config["name"]
+        agent_tools, system_prompt = self._agent_template(pool)
         
         try:
-            # Filter tools to only include available ones
-            agent_tools = {name: tool for name, tool in self.tools.items() if name in tools and name in self.tools}
-            system_prompt = f"You are a {name}. {instructions}\n\nAvailable tools: {', '.join(agent_tools.keys())}"
-            
             # Create agent only if LLM client is available
             if not self.llm_client:
                 logger.error(f"Cannot create agent {name}: LLM client not available")
@@ -248,16 +515,16 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
                 llm_client=self.llm_client,
                 tools=agent_tools,
                 system_prompt=system_prompt,
-                max_iterations=20
+                max_iterations=20,
+                temperature=config["temperature"]
             )
             logger.info(f"✅ Real BaseAgent created for {name} with {len(agent_tools)} tools")
             
             # Create agent instance wrapper
-            agent_instance = AgentInstance(agent_id, agent_type, agent)
-            self.agents[agent_id] = agent_instance
+            agent_instance = AgentInstance(agent_id, agent_type, agent, pool)
             
             logger.info(f"Created agent: {name} ({agent_id})")
-            return agent_id
+            return agent_instance
             
         except Exception as e:
             logger.error(f"Failed to create agent {name}: {e}")
@@ -270,32 +537,101 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
         context: Optional[Dict[str, Any]] = None,
         session_id: Optional[str] = None,
         max_iterations: int = 20
-    ) -> Dict[str, Any]:
-        """Run an agent with user input"""
-        start_time = time.time()
+    ) -> RunResult:
+        """Run an agent with user input
+        
+        The agent is borrowed from the pool for its type for the duration of
+        the run. Conversation history belongs to the session, so any idle
+        agent of the type can serve any session.
+        
+        Cacheable runs (see _response_cache_key) are answered from the
+        response cache, and identical ones arriving while the first is still
+        running wait for its result instead of calling the LLM again.
+        """
+        start_time = time.monotonic()
         
         try:
-            # Find or create agent for this session
-            agent_id = await self._get_agent_for_session(session_id, agent_type)
-            agent_instance = self.agents[agent_id]
-            agent_instance.update_last_used()
+            # Check if LLM client is available
+            if not self.llm_client:
+                raise Exception("LLM client not available. Please check your Azure OpenAI connection.")
             
-            # Update context if provided
-            if context:
-                agent_instance.context.update(context)
+            cache_key = self._response_cache_key(agent_type, user_input, context, session_id, max_iterations)
+            if cache_key is None:
+                return await self._execute_run(user_input, agent_type, context, session_id, start_time)
             
-            # Create proper Context object for the agent
-            from spartacus_services.context import Context
-            agent_context = Context()
-            agent_context.message_history = agent_instance.context.get("messages", [])
+            # Repeated deterministic prompts are answered from the cache, or
+            # from the identical run already in flight
+            while True:
+                cached = self._resp_cache.get(cache_key)
+                if cached is not None:
+                    return self._cache_hit(cached, start_time)
+                pending = self._inflight.get(cache_key)
+                if pending is None:
+                    break
+                try:
+                    cached = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    # Only the leading run was cancelled: look again, and run
+                    # the request here if no other waiter took over
+                    if not pending.cancelled() or asyncio.current_task().cancelling():
+                        raise
+                    continue
+                return self._cache_hit(cached, start_time)
             
-            # Add Gmail client to context using the context system
-            if self.gmail_client:
-                agent_context.session_data["gmail_client"] = self.gmail_client
+            pending = self._inflight[cache_key] = asyncio.get_running_loop().create_future()
+            try:
+                result = await self._execute_run(user_input, agent_type, context, session_id, start_time)
+            except asyncio.CancelledError:
+                pending.cancel()
+                raise
+            except BaseException as e:
+                pending.set_exception(e)
+                # Mark it retrieved so a run nobody waited on does not warn
+                pending.exception()
+                raise
+            else:
+                # Callers own the context they get back, so the cache and
+                # waiting runs get their own copy
+                snapshot = replace(result, context=copy.deepcopy(result.context))
+                pending.set_result(snapshot)
+                self._resp_cache.set(cache_key, snapshot)
+            finally:
+                del self._inflight[cache_key]
+            return result
             
-            # Check if LLM client is available
-            if not self.llm_client:
-                raise Exception("LLM client not available. Please check your Azure OpenAI connection.")
+        except Exception as e:
+            logger.error(f"Agent execution failed: {e}")
+            raise
+    
+    async def _execute_run(
+        self,
+        user_input: str,
+        agent_type: str,
+        context: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+        start_time: float
+    ) -> RunResult:
+        """Borrow an agent and run it once"""
+        session_context = self._get_session_context(session_id)
+        
+        # Update context if provided
+        if context:
+            session_context.update(context)
+        
+        # Create proper Context object for the agent
+        agent_context = Context()
+        agent_context.message_history = session_context.get("messages", [])
+        
+        # Add Gmail client to context using the context system
+        if self.gmail_client:
+            agent_context.session_data["gmail_client"] = self.gmail_client
+        
+        async with self._agent_ctx(agent_type) as agent_instance:
+            agent_id = agent_instance.id
+            agent_instance.update_last_used()
+            agent_instance.context = session_context
+            if session_id:
+                self._bind_session(session_id, agent_id)
             
             # Run the agent with Azure OpenAI
             logger.info(f"Running real agent {agent_id} with Azure OpenAI")
@@ -303,44 +639,230 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
                 user_input, 
                 agent_context
             )
-            
-            response = agent_response.final_answer or agent_response.text_response or "Agent completed successfully"
-            tools_used = agent_response.tools_executed
-            iterations = agent_response.iterations
-            
-            # Update context with new messages
-            agent_instance.context["messages"] = agent_context.message_history
-            
-            execution_time = time.time() - start_time
-            
-            return {
-                "agent_id": agent_id,
-                "agent_type": agent_type,
-                "response": response,
-                "iterations": iterations,
-                "execution_time": execution_time,
-                "tools_used": tools_used,
-                "context": agent_instance.context
-            }
-            
-        except Exception as e:
-            logger.error(f"Agent execution failed: {e}")
-            raise
+        
+        response = agent_response.final_answer or agent_response.text_response or "Agent completed successfully"
+        # Tuple, matching the read-only tools_used fields of the response models
+        tools_used = tuple(agent_response.tools_executed)
+        iterations = agent_response.iterations
+        
+        # Update context with new messages
+        session_context["messages"] = agent_context.message_history
+        
+        execution_time = time.monotonic() - start_time
+        
+        return RunResult(
+            agent_id=agent_id,
+            agent_type=agent_type,
+            response=response,
+            iterations=iterations,
+            execution_time=execution_time,
+            tools_used=tools_used,
+            context=session_context
+        )
     
-    async def _get_agent_for_session(self, session_id: Optional[str], agent_type: str) -> str:
-        """Get or create agent for a session"""
-        if session_id and session_id in self.active_sessions:
-            return self.active_sessions[session_id]
+    async def run_agent_stream(
+        self,
+        user_input: str,
+        agent_type: str = AgentType.DEFAULT.value,
+        context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        max_iterations: int = 20
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run an agent and yield its response as events
         
-        # Find an available agent of the requested type
-        for agent_id, agent_instance in self.agents.items():
-            if agent_instance.type == agent_type and agent_instance.active:
-                if session_id:
-                    self.active_sessions[session_id] = agent_id
-                return agent_id
+        Yields {"type": "delta", "text": ...} events for the response text,
+        followed by one {"type": "done", ...} event carrying the run_agent
+        metadata. The agent loop only produces its answer once final_answer
+        is called, so today the text arrives as a single delta.
+        """
+        result = await self.run_agent(
+            user_input=user_input,
+            agent_type=agent_type,
+            context=context,
+            session_id=session_id,
+            max_iterations=max_iterations
+        )
+        
+        yield {"type": "delta", "text": result.response}
+        yield {
+            "type": "done",
+            "agent_type": result.agent_type,
+            "tools_used": result.tools_used,
+            "iterations": result.iterations,
+            "execution_time": result.execution_time
+        }
+    
+    async def run_agent_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Union[RunResult, BaseException]]:
+        """Run several agent inputs concurrently
+        
+        Each item holds run_agent keyword arguments. At most max_concurrency
+        runs (settings.batch_concurrency by default) are in flight at once,
+        and each borrows its own agent from the pool. Results come back in
+        input order; a failed run yields its exception instead of a result.
+        on_progress, if given, is called with (completed, total) after each run.
+        """
+        sem = asyncio.Semaphore(max_concurrency or settings.batch_concurrency)
+        total = len(inputs)
+        completed = 0
+        
+        async def _one(item: Dict[str, Any]) -> RunResult:
+            nonlocal completed
+            async with sem:
+                try:
+                    return await self.run_agent(**item)
+                finally:
+                    completed += 1
+                    if on_progress is not None:
+                        on_progress(completed, total)
+        
+        return await asyncio.gather(*(_one(item) for item in inputs), return_exceptions=True)
+    
+    def _response_cache_key(
+        self,
+        agent_type: str,
+        user_input: str,
+        context: Optional[Dict[str, Any]],
+        session_id: Optional[str],
+        max_iterations: int
+    ) -> Optional[Tuple[str, str, int]]:
+        """Cache key for a run whose answer depends only on its input, else None
+        
+        Only runs without session history or extra context, served by a pool
+        configured with temperature 0, are cacheable. The temperature is sent
+        with every LLM call of such agents (see BaseAgent). The key holds the
+        pool rather than the agent type, so it names the exact configuration
+        _acquire lends for the run.
+        """
+        if context or session_id:
+            return None
+        pool = self._type_pools.get(agent_type)
+        if pool is None or self._agent_configs[pool]["temperature"] != 0:
+            return None
+        return (pool, user_input, max_iterations)
+    
+    @staticmethod
+    def _cache_hit(cached: RunResult, start_time: float) -> RunResult:
+        """A cached run result, with its own copy of the context"""
+        return replace(
+            cached,
+            context=copy.deepcopy(cached.context),
+            execution_time=time.monotonic() - start_time,
+            cache_hit=True
+        )
+    
+    def _get_session_context(self, session_id: Optional[str]) -> Dict[str, Any]:
+        """Get the conversation context of a session; a fresh one without a session
+        
+        Marks the session as recently used. Creating a context beyond
+        settings.max_active_sessions evicts the least recently used session.
+        """
+        if not session_id:
+            return _new_context()
+        session_context = self.session_contexts.get(session_id)
+        if session_context is not None:
+            self.session_contexts.move_to_end(session_id)
+            return session_context
+        
+        session_context = self.session_contexts[session_id] = _new_context()
+        while len(self.session_contexts) > settings.max_active_sessions:
+            self._evict_session(next(iter(self.session_contexts)))
+        return session_context
+    
+    def _evict_session(self, session_id: str):
+        """Forget a session's context and agent binding"""
+        self.session_contexts.pop(session_id, None)
+        agent_id = self.active_sessions.pop(session_id, None)
+        if agent_id is not None:
+            sessions = self.agent_to_sessions.get(agent_id)
+            if sessions is not None:
+                sessions.discard(session_id)
+    
+    def _bind_session(self, session_id: str, agent_id: str):
+        """Record agent_id as the agent serving session_id"""
+        previous = self.active_sessions.get(session_id)
+        if previous is not None:
+            self.active_sessions.move_to_end(session_id)
+            if previous == agent_id:
+                return
+            sessions = self.agent_to_sessions.get(previous)
+            if sessions is not None:
+                sessions.discard(session_id)
+        self.active_sessions[session_id] = agent_id
+        self.agent_to_sessions[agent_id].add(session_id)
+    
+    async def _acquire(self, agent_type: str) -> AgentInstance:
+        """Borrow an idle agent from the pool serving agent_type, creating one if none is idle
+        
+        Waits while AGENT_POOL_MAX_SIZE agents of the pool are borrowed.
+        """
+        pool = self._type_pools.get(agent_type)
+        if pool is None:
+            raise Exception(f"No agent available for type: {agent_type}")
+        sem = self._sems.get(pool)
+        if sem is None:
+            sem = self._sems[pool] = asyncio.Semaphore(AGENT_POOL_MAX_SIZE)
+        await sem.acquire()
+        
+        try:
+            idle = self._idle[pool]
+            agent_instance = None
+            while idle:
+                candidate = idle.popleft()
+                # Skip agents deactivated or deleted while idle
+                if self._is_pooled(candidate):
+                    agent_instance = candidate
+                    self.pool_hits += 1
+                    break
+            
+            if agent_instance is None:
+                agent_instance = self._new_agent_instance(agent_type, pool)
+                self._pool_clones[agent_instance.id] = agent_instance
+        except BaseException:
+            sem.release()
+            raise
         
-        # No available agent found
-        raise Exception(f"No agent available for type: {agent_type}")
+        self.total_borrows += 1
+        self._in_use[pool].add(agent_instance.id)
+        return agent_instance
+    
+    def _release(self, agent_instance: AgentInstance):
+        """Return a borrowed agent to the pool with a clean context"""
+        agent_instance.context = _new_context()
+        self._in_use[agent_instance.pool].discard(agent_instance.id)
+        if self._is_pooled(agent_instance):
+            self._idle[agent_instance.pool].append(agent_instance)
+        self._sems[agent_instance.pool].release()
+    
+    def _is_pooled(self, agent_instance: AgentInstance) -> bool:
+        """Whether an agent is still active and registered, so it can be lent again"""
+        return agent_instance.active and (
+            agent_instance.id in self.agents or agent_instance.id in self._pool_clones
+        )
+    
+    @asynccontextmanager
+    async def _agent_ctx(self, agent_type: str):
+        """Borrow an agent of agent_type for the body of an async with block"""
+        agent_instance = await self._acquire(agent_type)
+        try:
+            yield agent_instance
+        finally:
+            self._release(agent_instance)
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Agent pool counters; idle and in_use count the pool serving each agent type"""
+        return {
+            "pool_hits": self.pool_hits,
+            "total_borrows": self.total_borrows,
+            "hit_rate": self.pool_hits / self.total_borrows if self.total_borrows else 0.0,
+            "clones": len(self._pool_clones),
+            "idle": {agent_type: len(self._idle.get(pool, ())) for agent_type, pool in self._type_pools.items()},
+            "in_use": {agent_type: len(self._in_use.get(pool, ())) for agent_type, pool in self._type_pools.items()}
+        }
     
     def _extract_tools_used(self, agent: BaseAgent) -> List[str]:
         """Extract list of tools used during agent execution"""
@@ -348,33 +870,53 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
         # For now, return empty list
         return []
     
-    async def get_available_agents(self) -> List[AgentInfo]:
-        """Get list of available agents"""
-        agents = []
-        for agent_id, agent_instance in self.agents.items():
-            agents.append(AgentInfo(
-                id=agent_id,
-                name=agent_instance.type.title() + " Agent",
-                description=f"Agent of type {agent_instance.type}",
-                type=agent_instance.type,
-                tools=list(self.tools.keys()),
-                model=getattr(settings, 'default_model', 'gpt-4'),
-                created_at=agent_instance.created_at,
-                active=agent_instance.active
-            ))
-        return agents
-    
-    async def get_available_tools(self) -> List[ToolInfo]:
-        """Get list of available tools"""
-        tools = []
-        for tool_name, tool in self.tools.items():
-            tools.append(ToolInfo(
-                name=tool_name,
-                description=getattr(tool, 'description', f"Tool: {tool_name}"),
-                parameters=getattr(tool, 'parameters', {}),
-                active=True
-            ))
-        return tools
+    def remove_agent(self, agent_id: str) -> bool:
+        """Deactivate and unregister an agent, dropping its session bindings
+        
+        Returns False if no such agent exists. A borrowed agent finishes its
+        run and is then left out of the pool.
+        """
+        agent_instance = self.agents.pop(agent_id, None)
+        if agent_instance is None:
+            return False
+        agent_instance.active = False
+        for session_id in self.agent_to_sessions.pop(agent_id, ()):
+            self.active_sessions.pop(session_id, None)
+        self._agents_info = None
+        return True
+    
+    def get_available_agents(self) -> List[AgentInfo]:
+        """Get list of available agents
+        
+        All fields come from the manager, so the models are built without
+        validation. The list is built once and reused until an agent is
+        added or removed or the tools are reloaded.
+        """
+        if self._agents_info is None:
+            self._agents_info = [
+                AgentInfo.model_construct(
+                    **agent_instance._info_template,
+                    tools=self._tools_tuple,
+                    active=agent_instance.active
+                )
+                for agent_instance in self.agents.values()
+            ]
+        return list(self._agents_info)
+    
+    def get_available_tools(self) -> List[ToolInfo]:
+        """Get list of available tools, reused until the tools are reloaded"""
+        if self._tools_info is None:
+            self._tools_info = [
+                ToolInfo.model_construct(
+                    name=tool_name,
+                    description=getattr(tool, 'description', None) or f"Tool: {tool_name}",
+                    parameters=getattr(tool, 'parameters', {}),
+                    category="general",
+                    enabled=True
+                )
+                for tool_name, tool in self.tools.items()
+            ]
+        return list(self._tools_info)
     
     async def execute_tool(
         self,
@@ -382,19 +924,32 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
         parameters: Dict[str, Any],
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Execute a tool directly"""
-        start_time = time.time()
+        """Execute a tool directly
+        
+        Raises ValueError for an unknown tool; failures of the tool itself are
+        reported in the result with success False.
+        """
+        tool = self.tools.get(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool '{tool_name}' not found")
+        
+        start_time = time.monotonic()
         
         try:
-            if tool_name not in self.tools:
-                raise ValueError(f"Tool '{tool_name}' not found")
+            cache_key = None
+            result = None
+            if tool_name in MEMOIZED_TOOLS:
+                cache_key = self._tool_cache_key(tool_name, parameters)
+                result = self._tool_cache.get(cache_key)
             
-            tool = self.tools[tool_name]
+            if result is None:
+                # Execute the tool, within its concurrency bound if it has one
+                async with self._tool_sems.get(tool_name, _UNLIMITED):
+                    result = await tool.invoke(self._tool_context(context), parameters)
+                if cache_key is not None:
+                    self._tool_cache.set(cache_key, result)
             
-            # Execute the tool
-            result = await tool.execute(**parameters)
-            
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             return {
                 "tool_name": tool_name,
@@ -406,24 +961,80 @@ Use Gmail tools efficiently and always conclude with final_answer when the reque
             
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             return {
                 "tool_name": tool_name,
+                "result": None,
                 "error": str(e),
                 "parameters": parameters,
                 "execution_time": execution_time,
                 "success": False
             }
     
+    def _tool_context(self, context: Optional[Dict[str, Any]]) -> Context:
+        """Context for a direct tool execution, with the shared Gmail client"""
+        tool_context = Context(metadata=dict(context or {}))
+        if self.gmail_client:
+            tool_context.session_data["gmail_client"] = self.gmail_client
+        return tool_context
+    
+    @staticmethod
+    def _tool_cache_key(tool_name: str, parameters: Dict[str, Any]) -> Tuple[str, bytes]:
+        """Cache key for a tool call, independent of parameter order"""
+        canonical = json.dumps(parameters, sort_keys=True, separators=(",", ":"), default=str)
+        return (tool_name, hashlib.blake2b(canonical.encode(), digest_size=16).digest())
+    
+    def clear_tool_cache(self):
+        """Forget memoized tool results, e.g. after the underlying data changed"""
+        self._tool_cache.clear()
+    
+    def _get_blocking_pool(self) -> ThreadPoolExecutor:
+        """Worker pool for blocking calls and cpu_bound tools, created on first use"""
+        if self._blocking_pool is None:
+            self._blocking_pool = ThreadPoolExecutor(
+                max_workers=BLOCKING_POOL_WORKERS,
+                thread_name_prefix="spartacus-blocking"
+            )
+        return self._blocking_pool
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call in the shared worker pool and await its result"""
+        return await asyncio.get_running_loop().run_in_executor(self._get_blocking_pool(), func, *args)
+    
+    @staticmethod
+    def _sample_stats() -> Dict[str, float]:
+        """Read the current resource usage; reads /proc, so it blocks"""
+        return {
+            "memory_usage": psutil.virtual_memory().percent,
+            "cpu_usage": psutil.cpu_percent(interval=None)
+        }
+    
+    async def _sample_stats_loop(self):
+        """Refresh the cached resource usage until cancelled"""
+        while True:
+            # A failed sample keeps the previous figures; the loop must survive it
+            try:
+                self._cached_stats = await self._run_blocking(self._sample_stats)
+            except Exception as e:
+                logger.error(f"Resource sampling failed: {e}")
+            await asyncio.sleep(STATS_INTERVAL if self.active_sessions else STATS_IDLE_INTERVAL)
+    
     def get_system_status(self) -> dict:
-        """System status"""
+        """System status
+        
+        Resource figures come from the background sampler, so this never
+        touches /proc itself.
+        """
         return {
             "status": "healthy",
             "llm_client": "Azure OpenAI" if self.llm_client else "Not available",
             "gmail_client": "Available" if GMAIL_TOOLS_AVAILABLE else "Not available", 
             "agents": list(self.agents.keys()),
-            "uptime": time.time() - self.start_time
+            "uptime": time.time() - self.start_time,
+            "active_agents": sum(1 for agent_instance in self.agents.values() if agent_instance.active),
+            "active_sessions": len(self.active_sessions),
+            **self._cached_stats
         }
 
 
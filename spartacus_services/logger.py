@@ -5,6 +5,7 @@ Recreated from app.services.utils.structured_logger
 
 import logging
 import json
+import os
 from typing import Any, Dict, Optional
 from datetime import datetime
 
@@ -106,6 +107,27 @@ class StructuredFormatter(logging.Formatter):
 # Create default logger instance
 logger = StructuredLogger()
 
+def add_file_handler(path: str, level: int = logging.INFO) -> logging.Handler:
+    """
+    Also write log records to a JSON-lines file.
+    
+    The handler is attached to the root logger, which every structured
+    logger propagates to. Remove it from there and close it when done.
+    
+    Args:
+        path: Log file path; its directory is created if missing
+        level: Lowest level written to the file
+        
+    Returns:
+        The attached handler
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setLevel(level)
+    handler.setFormatter(StructuredFormatter())
+    logging.getLogger().addHandler(handler)
+    return handler
+
 def get_logger(name: str = "spartacus") -> StructuredLogger:
     """
     Get a logger instance for the given name.
@@ -0,0 +1,209 @@
+"""
+Shared pytest fixtures for Spartacus tests
+"""
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+BACKEND_HOST = "127.0.0.1"
+BACKEND_PORT = 8000
+BASE_URL = f"http://{BACKEND_HOST}:{BACKEND_PORT}"
+BACKEND_STARTUP_TIMEOUT = 30.0
+
+
+def _port_in_use(host: str, port: int) -> bool:
+    """Check whether something is already listening on host:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        return sock.connect_ex((host, port)) == 0
+
+
+def _wait_for_health(process: subprocess.Popen, timeout: float) -> bool:
+    """Poll /health with exponential backoff until it answers or the backend exits"""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            if httpx.get(f"{BASE_URL}/health", timeout=0.5).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+
+    return False
+
+
+@pytest.fixture(scope="session")
+def backend_url(tmp_path_factory):
+    """Start one backend for the whole test session and yield its base URL
+
+    Backend output goes to a log file rather than a pipe nobody drains, so
+    it can never block on a full pipe buffer.
+    """
+    if _port_in_use(BACKEND_HOST, BACKEND_PORT):
+        pytest.skip(f"Port {BACKEND_PORT} already in use - stop the running backend first")
+
+    cmd = [
+        sys.executable, "-m", "uvicorn", "spartacus_backend.main:app",
+        "--host", BACKEND_HOST,
+        "--port", str(BACKEND_PORT),
+        "--log-level", "warning",
+    ]
+    env = {**os.environ, "PYTHONPATH": str(project_root)}
+    log_path = tmp_path_factory.mktemp("backend") / "backend.log"
+
+    with open(log_path, "wb") as log_file:
+        process = subprocess.Popen(
+            cmd,
+            cwd=project_root,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT
+        )
+
+    try:
+        if not _wait_for_health(process, BACKEND_STARTUP_TIMEOUT):
+            pytest.skip(f"Backend did not become ready - check Azure OpenAI configuration (log: {log_path})")
+
+        yield BASE_URL
+
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client(backend_url):
+    """Pooled async HTTP client shared by every API test in the session
+
+    HTTP/2 is enabled when h2 is installed so concurrent requests can be
+    multiplexed over one connection by servers that negotiate it.
+    """
+    async with httpx.AsyncClient(
+        base_url=backend_url,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        timeout=30.0
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def gmail_mcp():
+    """Start one Gmail MCP server for the whole test session and share its client"""
+    if shutil.which("node") is None:
+        pytest.skip("Node.js not available")
+    if not (project_root / "mcp_servers" / "gmail" / "dist" / "index.js").is_file():
+        pytest.skip("Gmail MCP not built - run 'npm run build'")
+    if not (Path.home() / ".gmail-mcp" / "gcp-oauth.keys.json").is_file():
+        pytest.skip("Gmail not configured - ~/.gmail-mcp credentials missing")
+
+    from spartacus_backend.services.mcp_gmail_client import GmailMCPClient
+
+    client = GmailMCPClient()
+    await client.start_server()
+
+    try:
+        yield client
+    finally:
+        await client.stop_server()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def agent_manager():
+    """Initialize one SpartacusAgentManager for the whole test session"""
+    from spartacus_backend.services.agent_manager import SpartacusAgentManager
+
+    manager = SpartacusAgentManager()
+    try:
+        await manager.initialize()
+    except RuntimeError as e:
+        pytest.skip(f"Agent manager could not initialize: {e}")
+
+    try:
+        yield manager
+    finally:
+        await manager.cleanup()
+
+
+class StubRuns:
+    """Counting stand-in for BaseAgent.run_until_final_answer
+
+    Each run waits delay seconds, records the agent it ran on and adds the
+    input to the conversation history.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.01
+        self.agents = []
+
+    async def __call__(self, agent, user_input, context):
+        self.calls += 1
+        self.agents.append(agent)
+        await asyncio.sleep(self.delay)
+        context.message_history.append({"role": "assistant", "content": user_input})
+        return SimpleNamespace(
+            final_answer=f"answer {self.calls}",
+            text_response=None,
+            tools_executed=[],
+            iterations=1
+        )
+
+
+@pytest.fixture
+def agent_runs(monkeypatch):
+    """Replace agent runs with a StubRuns for the test"""
+    from spartacus_backend.services import agent_manager as agent_manager_module
+
+    stub = StubRuns()
+
+    async def run_until_final_answer(self, user_input, context):
+        return await stub(self, user_input, context)
+
+    monkeypatch.setattr(agent_manager_module.BaseAgent, "run_until_final_answer", run_until_final_answer)
+    return stub
+
+
+@pytest.fixture
+def offline_manager(agent_runs):
+    """SpartacusAgentManager that runs agents without Azure OpenAI
+
+    The LLM client is a placeholder and agent runs go to agent_runs.
+    """
+    from spartacus_backend.services.agent_manager import SpartacusAgentManager
+
+    manager = SpartacusAgentManager()
+    manager.llm_client = object()
+    return manager
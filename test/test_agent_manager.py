@@ -0,0 +1,31 @@
+"""
+Agent manager tests
+
+All tests share the SpartacusAgentManager initialized by the
+agent_manager fixture.
+"""
+import pytest
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestAgentManager:
+    """Test agent manager setup and execution"""
+
+    async def test_default_agents_created(self, agent_manager):
+        """Test that a default agent and the final_answer tool are registered"""
+        agent_types = {agent.type for agent in agent_manager.agents.values()}
+        assert "default" in agent_types
+        assert "final_answer" in agent_manager.tools
+
+    async def test_email_agent(self, agent_manager):
+        """Test that the email agent answers a question about its tools"""
+        if not any(agent.type == "email" for agent in agent_manager.agents.values()):
+            pytest.skip("Email agent not available - Gmail tools not configured")
+
+        result = await agent_manager.run_agent(
+            user_input="¿Qué herramientas Gmail tienes disponibles?",
+            agent_type="email"
+        )
+        assert result.response
+        assert result.agent_type == "email"
@@ -0,0 +1,124 @@
+"""
+Agent pool tests
+
+Run offline on the offline_manager fixture, so no Azure OpenAI connection
+is needed.
+"""
+import asyncio
+
+import pytest
+
+from spartacus_backend.services import agent_manager as agent_manager_module
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create(manager, agent_type="default", **overrides):
+    config = {
+        "name": f"{agent_type} agent",
+        "description": "test agent",
+        "instructions": "Answer briefly.",
+        "tools": [],
+        **overrides
+    }
+    return await manager.create_agent(agent_type=agent_type, **config)
+
+
+class TestAgentPool:
+    """Test borrowing and returning pooled agents"""
+
+    async def test_idle_agent_is_reused(self, offline_manager):
+        """Test that a released agent is lent again instead of creating a new one"""
+        agent_id = await _create(offline_manager)
+
+        async with offline_manager._agent_ctx("default") as first:
+            assert first.id == agent_id
+        async with offline_manager._agent_ctx("default") as second:
+            assert second is first
+
+        stats = offline_manager.pool_stats()
+        assert stats["pool_hits"] == 2
+        assert stats["total_borrows"] == 2
+        assert stats["clones"] == 0
+        assert stats["in_use"] == {"default": 0}
+
+    async def test_release_resets_context(self, offline_manager):
+        """Test that a returned agent does not keep the session context it ran with"""
+        await _create(offline_manager)
+
+        async with offline_manager._agent_ctx("default") as agent_instance:
+            agent_instance.context = {"messages": [{"role": "user", "content": "hi"}], "session_data": {}}
+        assert agent_instance.context["messages"] == []
+
+    async def test_concurrent_runs_grow_pool_without_listing_clones(self, offline_manager):
+        """Test that extra instances serve concurrent runs but are not listed as agents"""
+        await _create(offline_manager)
+
+        results = await asyncio.gather(*(
+            offline_manager.run_agent(f"question {i}", session_id=f"s{i}") for i in range(5)
+        ))
+
+        assert len({result.agent_id for result in results}) == 5
+        assert len(offline_manager.agents) == 1
+        assert len(offline_manager.get_available_agents()) == 1
+        assert offline_manager.pool_stats()["clones"] == 4
+        assert offline_manager.pool_stats()["idle"] == {"default": 5}
+
+    async def test_borrows_wait_at_pool_limit(self, offline_manager, monkeypatch):
+        """Test that no more than AGENT_POOL_MAX_SIZE agents of a type are lent at once"""
+        monkeypatch.setattr(agent_manager_module, "AGENT_POOL_MAX_SIZE", 2)
+        await _create(offline_manager)
+
+        first = await offline_manager._acquire("default")
+        second = await offline_manager._acquire("default")
+        third = asyncio.ensure_future(offline_manager._acquire("default"))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        offline_manager._release(first)
+        assert (await asyncio.wait_for(third, timeout=1)) is first
+        offline_manager._release(second)
+        offline_manager._release(first)
+        assert offline_manager.pool_stats()["in_use"] == {"default": 0}
+
+    async def test_unknown_type_raises_and_frees_slot(self, offline_manager, monkeypatch):
+        """Test that borrowing an unknown type fails without leaking a pool slot"""
+        monkeypatch.setattr(agent_manager_module, "AGENT_POOL_MAX_SIZE", 1)
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="No agent available for type: research"):
+                await offline_manager._acquire("research")
+
+    async def test_removed_agent_is_not_lent_again(self, offline_manager):
+        """Test that an agent removed while idle is skipped by the pool"""
+        agent_id = await _create(offline_manager)
+        assert offline_manager.remove_agent(agent_id)
+
+        async with offline_manager._agent_ctx("default") as agent_instance:
+            assert agent_instance.id != agent_id
+        assert offline_manager.pool_stats()["pool_hits"] == 0
+
+    async def test_other_configs_of_a_type_do_not_serve_its_runs(self, offline_manager, agent_runs):
+        """Test that runs of a type only go to agents with its first configuration"""
+        first_id = await _create(offline_manager, "custom", name="Det", temperature=0)
+        await _create(offline_manager, "custom", name="Poet", temperature=1.0)
+
+        for i in range(3):
+            result = await offline_manager.run_agent(f"question {i}", agent_type="custom")
+            assert result.agent_id == first_id
+        await asyncio.gather(*(
+            offline_manager.run_agent(f"question {i}", agent_type="custom", session_id=f"s{i}") for i in range(3)
+        ))
+
+        assert [agent.temperature for agent in agent_runs.agents] == [0] * 6
+        assert len(offline_manager.agents) == 2
+
+    async def test_same_config_shares_pool(self, offline_manager):
+        """Test that agents created with the same configuration are lent from one pool"""
+        first_id = await _create(offline_manager)
+        second_id = await _create(offline_manager)
+
+        async with offline_manager._agent_ctx("default") as first:
+            async with offline_manager._agent_ctx("default") as second:
+                assert {first.id, second.id} == {first_id, second_id}
+        assert offline_manager.pool_stats()["clones"] == 0
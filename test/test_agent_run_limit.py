@@ -0,0 +1,74 @@
+"""
+Chat agent run limit tests
+"""
+import asyncio
+
+import pytest
+
+from spartacus_backend.api.chat import _AgentRunLimiter
+from spartacus_backend.config.settings import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAgentRunLimiter:
+    """Test the cap on concurrent chat agent runs"""
+
+    async def test_runs_never_exceed_max_agents(self, monkeypatch):
+        """Test that no more than settings.max_agents runs hold a slot at once"""
+        monkeypatch.setattr(settings, "max_agents", 2)
+        limiter = _AgentRunLimiter()
+        peak = 0
+
+        async def run():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.running)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(run() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.running == 0
+
+    async def test_config_change_applies_without_restart(self, monkeypatch):
+        """Test that raising max_agents lets more waiting runs start once a slot frees"""
+        monkeypatch.setattr(settings, "max_agents", 1)
+        limiter = _AgentRunLimiter()
+        first_done, release = asyncio.Event(), asyncio.Event()
+
+        async def run(done):
+            async with limiter:
+                await done.wait()
+
+        first = asyncio.ensure_future(run(first_done))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(run(release)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert limiter.running == 1
+
+        monkeypatch.setattr(settings, "max_agents", 3)
+        first_done.set()
+        await asyncio.sleep(0.01)
+        assert limiter.running == 3
+
+        release.set()
+        await asyncio.gather(first, *waiters)
+        assert limiter.running == 0
+
+    async def test_lowered_limit_holds_back_new_runs(self, monkeypatch):
+        """Test that lowering max_agents stops new runs until enough slots free"""
+        monkeypatch.setattr(settings, "max_agents", 2)
+        limiter = _AgentRunLimiter()
+        await limiter.__aenter__()
+        await limiter.__aenter__()
+
+        monkeypatch.setattr(settings, "max_agents", 1)
+        waiter = asyncio.ensure_future(limiter.__aenter__())
+        await limiter.__aexit__(None, None, None)
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await limiter.__aexit__(None, None, None)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.running == 1
@@ -0,0 +1,47 @@
+"""
+API tests against a live Spartacus backend
+
+The backend is started once per session by the backend_url fixture and
+every request goes through the pooled api_client fixture.
+"""
+import pytest
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+ENDPOINT_CASES = [
+    pytest.param("GET", "/health", None, id="health"),
+    pytest.param("GET", "/", None, id="root"),
+    pytest.param("GET", "/api/system/status", None, id="system-status"),
+    pytest.param("GET", "/api/agents/list", None, id="agents-list"),
+    pytest.param("GET", "/api/tools/list", None, id="tools-list"),
+    pytest.param(
+        "POST", "/api/chat/message",
+        {"message": "Hello, this is a test", "agent_type": "default"},
+        id="chat-message"
+    ),
+]
+
+
+class TestApiEndpoints:
+    """Test the main REST endpoints"""
+
+    @pytest.mark.parametrize("method,path,payload", ENDPOINT_CASES)
+    async def test_endpoint_ok(self, api_client, method, path, payload):
+        """Test that each endpoint answers with 200"""
+        response = await api_client.request(method, path, json=payload, timeout=60)
+        assert response.status_code == 200
+
+    async def test_health(self, api_client):
+        """Test that /health reports a healthy backend"""
+        response = await api_client.get("/health")
+        assert response.json()["status"] == "healthy"
+
+    async def test_chat_message(self, api_client):
+        """Test that /api/chat/message returns an assistant message"""
+        response = await api_client.post(
+            "/api/chat/message",
+            json={"message": "Hello, this is a test", "agent_type": "default"},
+            timeout=60
+        )
+        assert response.status_code == 200
+        assert response.json()["message"]["role"] == "assistant"
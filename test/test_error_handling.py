@@ -0,0 +1,49 @@
+"""
+Error responses of the API routes
+
+Runs the real app in-process without its lifespan, with a stub agent
+manager in place of the Azure-backed one.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from spartacus_backend.main import app, _register_routers
+from spartacus_backend.config.settings import settings
+
+
+class FailingAgentManager:
+    """Agent manager whose agent runs always fail"""
+
+    async def run_agent(self, **kwargs):
+        raise RuntimeError("LLM unavailable")
+
+
+@pytest.fixture
+def client():
+    _register_routers(app)
+    app.state.agent_manager = FailingAgentManager()
+    try:
+        yield TestClient(app, raise_server_exceptions=False)
+    finally:
+        del app.state.agent_manager
+
+
+class TestErrorHandling:
+    """Test that unexpected endpoint errors become readable 500 responses"""
+
+    def test_500_keeps_cors_headers(self, client):
+        """Test that the frontend origin can still read a 500 response"""
+        origin = settings.cors_origins[0]
+        response = client.post(
+            "/api/chat/message",
+            json={"message": "Hello"},
+            headers={"Origin": origin}
+        )
+        assert response.status_code == 500
+        assert response.headers["access-control-allow-origin"] == origin
+        assert response.json()["detail"] == "/api/chat/message failed: LLM unavailable"
+
+    def test_validation_errors_stay_422(self, client):
+        """Test that request validation errors are not turned into 500s"""
+        response = client.post("/api/chat/message", json={"agent_type": "default"})
+        assert response.status_code == 422
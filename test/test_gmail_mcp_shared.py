@@ -0,0 +1,33 @@
+"""
+Gmail MCP client tests
+
+All tests share the single MCP server started by the gmail_mcp fixture.
+"""
+import pytest
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestGmailMCPClient:
+    """Test the Gmail MCP client against a running server"""
+
+    async def test_search_inbox(self, gmail_mcp):
+        """Test that an inbox search returns parsed emails"""
+        emails = await gmail_mcp.search_emails("in:inbox", max_results=1)
+        assert isinstance(emails, list)
+        for email in emails:
+            assert "id" in email
+
+    async def test_read_email(self, gmail_mcp):
+        """Test that the first inbox email can be read"""
+        emails = await gmail_mcp.search_emails("in:inbox", max_results=1)
+        if not emails:
+            pytest.skip("Inbox is empty")
+
+        email = await gmail_mcp.read_email(emails[0]["id"])
+        assert email.get("id") == emails[0]["id"]
+
+    async def test_list_labels(self, gmail_mcp):
+        """Test that labels are listed"""
+        labels = await gmail_mcp.list_labels()
+        assert any(label["id"] == "INBOX" for label in labels)
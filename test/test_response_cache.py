@@ -0,0 +1,157 @@
+"""
+Response cache tests
+
+Run offline on the offline_manager fixture; agent_runs counts the runs that
+reach the agent.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from agentic_lib.base_agent import BaseAgent
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def manager(offline_manager):
+    manager = offline_manager
+    await manager.create_agent(
+        agent_type="custom",
+        name="Deterministic Agent",
+        description="test agent",
+        instructions="Answer briefly.",
+        tools=[],
+        temperature=0
+    )
+    return manager
+
+
+class TestResponseCache:
+    """Test caching of stateless temperature 0 runs"""
+
+    async def test_temperature_is_sent_to_llm(self):
+        """Test that an agent's temperature reaches every LLM call"""
+        calls = []
+
+        class RecordingClient:
+            async def invoke(self, **kwargs):
+                calls.append(kwargs)
+
+        await BaseAgent(RecordingClient(), {}, "prompt", temperature=0)._call_llm_with_tools([])
+        await BaseAgent(RecordingClient(), {}, "prompt")._call_llm_with_tools([])
+        assert calls[0]["temperature"] == 0
+        assert "temperature" not in calls[1]
+
+    async def test_repeated_run_hits_cache(self, manager, agent_runs):
+        """Test that an identical stateless run is answered from the cache"""
+        first = await manager.run_agent("hello", agent_type="custom")
+        second = await manager.run_agent("hello", agent_type="custom")
+
+        assert agent_runs.calls == 1
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert second.response == first.response
+
+    async def test_cache_hits_get_own_context(self, manager, agent_runs):
+        """Test that changing a returned context does not change later hits"""
+        first = await manager.run_agent("hello", agent_type="custom")
+        first.context["messages"].clear()
+        second = await manager.run_agent("hello", agent_type="custom")
+        second.context["session_data"]["changed"] = True
+        third = await manager.run_agent("hello", agent_type="custom")
+
+        assert second.context is not third.context
+        assert len(third.context["messages"]) == 1
+        assert third.context["session_data"] == {}
+
+    async def test_key_includes_max_iterations(self, manager, agent_runs):
+        """Test that runs differing only in max_iterations are cached separately"""
+        await manager.run_agent("hello", agent_type="custom", max_iterations=5)
+        result = await manager.run_agent("hello", agent_type="custom", max_iterations=10)
+        assert agent_runs.calls == 2
+        assert not result.cache_hit
+
+    async def test_stateful_and_sampled_runs_are_not_cached(self, manager, agent_runs):
+        """Test that session runs and agents without temperature 0 bypass the cache"""
+        await manager.create_agent(
+            agent_type="default", name="Default Agent", description="test agent",
+            instructions="Answer briefly.", tools=[]
+        )
+        for _ in range(2):
+            await manager.run_agent("hello", agent_type="custom", session_id="s1")
+            await manager.run_agent("hello", agent_type="default")
+        assert agent_runs.calls == 4
+
+    async def test_other_config_of_type_is_not_cached_as_it(self, manager, agent_runs):
+        """Test that a second configuration of a type never answers under the first one's key"""
+        await manager.create_agent(
+            agent_type="custom", name="Poet", description="test agent",
+            instructions="Answer in verse.", tools=[], temperature=1.0
+        )
+        for _ in range(3):
+            await manager.run_agent("new input", agent_type="custom")
+            await manager.run_agent("other input", agent_type="custom")
+
+        assert agent_runs.calls == 2
+        assert [agent.temperature for agent in agent_runs.agents] == [0, 0]
+
+    async def test_sampled_first_config_is_not_cached(self, offline_manager, agent_runs):
+        """Test that a type served by a sampled configuration stays uncached after a temperature 0 one is added"""
+        for name, temperature in (("Poet", 1.0), ("Det", 0)):
+            await offline_manager.create_agent(
+                agent_type="custom", name=name, description="test agent",
+                instructions="Answer briefly.", tools=[], temperature=temperature
+            )
+        for _ in range(2):
+            result = await offline_manager.run_agent("hello", agent_type="custom")
+
+        assert agent_runs.calls == 2
+        assert not result.cache_hit
+
+
+class TestInflightCoalescing:
+    """Test that identical runs in flight share one LLM call"""
+
+    async def test_waiters_share_leading_run(self, manager, agent_runs):
+        """Test that runs arriving while the first is in flight wait for its result"""
+        agent_runs.delay = 0.05
+        results = await asyncio.gather(*(
+            manager.run_agent("hello", agent_type="custom") for _ in range(3)
+        ))
+
+        assert agent_runs.calls == 1
+        assert [result.cache_hit for result in results] == [False, True, True]
+        assert results[1].context is not results[2].context
+
+    async def test_waiter_runs_itself_when_leader_is_cancelled(self, manager, agent_runs):
+        """Test that cancelling the leading run does not cancel the runs waiting on it"""
+        agent_runs.delay = 0.05
+        leader = asyncio.ensure_future(manager.run_agent("hello", agent_type="custom"))
+        await asyncio.sleep(0.01)
+        followers = [asyncio.ensure_future(manager.run_agent("hello", agent_type="custom")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert agent_runs.calls == 2
+        assert sorted(result.cache_hit for result in results) == [False, True]
+        assert not manager._inflight
+
+    async def test_cancelled_waiter_does_not_cancel_leader(self, manager, agent_runs):
+        """Test that a waiter cancelled by its own caller leaves the leading run alone"""
+        agent_runs.delay = 0.05
+        leader = asyncio.ensure_future(manager.run_agent("hello", agent_type="custom"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(manager.run_agent("hello", agent_type="custom"))
+        await asyncio.sleep(0.01)
+
+        follower.cancel()
+        result = await leader
+
+        assert follower.cancelled()
+        assert not result.cache_hit
+        assert agent_runs.calls == 1
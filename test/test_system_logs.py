@@ -0,0 +1,69 @@
+"""
+Log file reading behind /api/system/logs
+"""
+import json
+import logging
+
+import pytest
+
+from spartacus_backend.api.system import _read_log_entries, _tail_log_entries
+from spartacus_services.logger import add_file_handler, get_logger
+
+
+def _write_log(path, entries, trailing_newline=True):
+    text = "\n".join(json.dumps(entry) for entry in entries)
+    path.write_text(text + ("\n" if trailing_newline else ""))
+
+
+@pytest.fixture
+def log_entries():
+    levels = ["INFO", "DEBUG", "WARNING", "INFO", "ERROR"] * 20
+    return [{"level": level, "message": f"entry {i:03d}"} for i, level in enumerate(levels)]
+
+
+class TestTailLogEntries:
+    """Test reading the last entries of a JSON-lines log file"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 8192])
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    def test_chunk_boundaries(self, tmp_path, log_entries, chunk_size, trailing_newline):
+        """Test that lines split across chunks are read whole, for any chunk size"""
+        path = tmp_path / "spartacus.log"
+        _write_log(path, log_entries, trailing_newline)
+
+        for count in (1, 5, len(log_entries), len(log_entries) + 10):
+            result = _tail_log_entries(str(path), count, logging.DEBUG, chunk_size=chunk_size)
+            assert result == log_entries[-count:]
+
+    def test_level_filter(self, tmp_path, log_entries):
+        """Test that entries below the minimum level are skipped"""
+        path = tmp_path / "spartacus.log"
+        _write_log(path, log_entries)
+
+        expected = [e for e in log_entries if e["level"] in ("WARNING", "ERROR")][-15:]
+        assert _tail_log_entries(str(path), 15, logging.WARNING, chunk_size=16) == expected
+
+    def test_skips_malformed_lines(self, tmp_path):
+        """Test that blank and non-JSON lines are ignored"""
+        path = tmp_path / "spartacus.log"
+        path.write_text('{"level": "INFO", "message": "a"}\nnot json\n\n[1, 2]\n{"level": "INFO", "message": "b"}\n')
+
+        messages = [e["message"] for e in _tail_log_entries(str(path), 10, logging.INFO, chunk_size=5)]
+        assert messages == ["a", "b"]
+
+    def test_missing_file_reads_empty(self, tmp_path):
+        """Test that a log file that does not exist yet gives no entries"""
+        assert _read_log_entries(str(tmp_path / "missing.log"), 10, logging.INFO) == []
+
+    def test_reads_backend_log_file(self, tmp_path):
+        """Test that entries written through the file handler can be read back"""
+        path = tmp_path / "logs" / "spartacus.log"
+        handler = add_file_handler(str(path))
+        try:
+            get_logger("spartacus.test_logs").warning("written to file")
+        finally:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
+
+        entries = _read_log_entries(str(path), 10, logging.INFO)
+        assert [(e["level"], e["message"]) for e in entries] == [("WARNING", "written to file")]
@@ -0,0 +1,49 @@
+"""
+System status tests
+
+Run offline against a manager that was never initialized.
+"""
+import asyncio
+
+import pytest
+
+from spartacus_backend.services import agent_manager as agent_manager_module
+from spartacus_backend.services.agent_manager import SpartacusAgentManager
+
+
+class TestSystemStatus:
+    """Test the system status reported by the agent manager"""
+
+    def test_status_shape(self):
+        """Test that the status keeps the keys existing clients read"""
+        status = SpartacusAgentManager().get_system_status()
+        assert status["status"] == "healthy"
+        for key in ("llm_client", "gmail_client", "agents", "uptime",
+                    "active_agents", "active_sessions", "memory_usage", "cpu_usage"):
+            assert key in status
+
+    @pytest.mark.asyncio
+    async def test_sampler_survives_errors(self, monkeypatch):
+        """Test that a failed resource sample is logged and sampling continues"""
+        monkeypatch.setattr(agent_manager_module, "STATS_IDLE_INTERVAL", 0.001)
+        samples = iter([OSError("/proc unavailable"), {"memory_usage": 12.5, "cpu_usage": 3.0}])
+
+        def sample():
+            result = next(samples, {"memory_usage": 12.5, "cpu_usage": 3.0})
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        manager = SpartacusAgentManager()
+        monkeypatch.setattr(manager, "_sample_stats", sample)
+        task = asyncio.ensure_future(manager._sample_stats_loop())
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.005)
+                if manager._cached_stats["memory_usage"] == 12.5:
+                    break
+            assert not task.done()
+            assert manager._cached_stats == {"memory_usage": 12.5, "cpu_usage": 3.0}
+        finally:
+            task.cancel()
+            manager._blocking_pool.shutdown()
@@ -0,0 +1,200 @@
+"""
+Direct tool execution tests
+
+Run offline with stub tools built on agentic_lib's Tool.
+"""
+import asyncio
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from agentic_lib.tools import Tool
+from spartacus_services.context import Context
+from spartacus_backend.services import agent_manager as agent_manager_module
+from spartacus_backend.services.agent_manager import SpartacusAgentManager
+
+pytestmark = pytest.mark.asyncio
+
+
+class LookupInput(BaseModel):
+    """Arguments of the stub tools"""
+    query: str
+
+
+class ConcurrencyProbe:
+    """Tool function that records how many calls run at once"""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, ctx, args: LookupInput) -> str:
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return f"{args.query} #{self.calls}"
+
+
+async def _manager_with_tool(monkeypatch, probe, name="lookup", limit=None):
+    if limit is not None:
+        monkeypatch.setattr(agent_manager_module, "TOOL_CONCURRENCY", {name: limit})
+    manager = SpartacusAgentManager()
+    manager.tools[name] = Tool(name=name, function=probe.run, args_schema=LookupInput)
+    await manager._load_tools()
+    return manager
+
+
+class TestExecuteTool:
+    """Test running tools directly through the agent manager"""
+
+    async def test_invokes_tool(self, monkeypatch):
+        """Test that a direct execution runs the tool and returns its result"""
+        probe = ConcurrencyProbe()
+        manager = await _manager_with_tool(monkeypatch, probe)
+
+        result = await manager.execute_tool("lookup", {"query": "inbox"}, {"session_id": "s1"})
+
+        assert result["success"], result.get("error")
+        assert result["result"] == "inbox #1"
+
+    async def test_invalid_parameters_fail(self, monkeypatch):
+        """Test that a tool call with bad parameters is reported as failed"""
+        manager = await _manager_with_tool(monkeypatch, ConcurrencyProbe())
+
+        result = await manager.execute_tool("lookup", {"wrong": 1})
+
+        assert not result["success"]
+        assert result["result"] is None
+
+    async def test_unknown_tool_raises(self, monkeypatch):
+        """Test that an unknown tool name raises ValueError, which the router maps to 404"""
+        manager = await _manager_with_tool(monkeypatch, ConcurrencyProbe())
+
+        with pytest.raises(ValueError, match="Tool 'missing' not found"):
+            await manager.execute_tool("missing", {})
+
+    async def test_concurrency_limit(self, monkeypatch):
+        """Test that concurrent calls never run more than the tool's limit at once"""
+        probe = ConcurrencyProbe()
+        manager = await _manager_with_tool(monkeypatch, probe, limit=2)
+
+        results = await asyncio.gather(*(
+            manager.execute_tool("lookup", {"query": f"q{i}"}) for i in range(8)
+        ))
+
+        assert all(result["success"] for result in results)
+        assert probe.calls == 8
+        assert probe.peak == 2
+
+    async def test_unlisted_tool_is_unbounded(self, monkeypatch):
+        """Test that tools without a configured limit run fully concurrently"""
+        probe = ConcurrencyProbe()
+        manager = await _manager_with_tool(monkeypatch, probe)
+
+        await asyncio.gather(*(manager.execute_tool("lookup", {"query": f"q{i}"}) for i in range(8)))
+
+        assert probe.peak == 8
+
+
+class TestToolMemoization:
+    """Test caching of read-only tool results"""
+
+    @pytest.fixture(autouse=True)
+    def memoize_lookup(self, monkeypatch):
+        monkeypatch.setattr(agent_manager_module, "MEMOIZED_TOOLS", frozenset({"lookup"}))
+
+    async def test_repeated_call_hits_cache(self, monkeypatch):
+        """Test that an identical call is answered without running the tool again"""
+        probe = ConcurrencyProbe(delay=0)
+        manager = await _manager_with_tool(monkeypatch, probe)
+
+        first = await manager.execute_tool("lookup", {"query": "inbox"})
+        second = await manager.execute_tool("lookup", {"query": "inbox"})
+
+        assert probe.calls == 1
+        assert second["result"] == first["result"] == "inbox #1"
+
+    async def test_different_parameters_miss(self, monkeypatch):
+        """Test that calls with other parameters are cached separately"""
+        probe = ConcurrencyProbe(delay=0)
+        manager = await _manager_with_tool(monkeypatch, probe)
+
+        await manager.execute_tool("lookup", {"query": "inbox"})
+        result = await manager.execute_tool("lookup", {"query": "sent"})
+
+        assert probe.calls == 2
+        assert result["result"] == "sent #2"
+
+    async def test_expired_entry_misses(self, monkeypatch):
+        """Test that a result older than the cache TTL runs the tool again"""
+        probe = ConcurrencyProbe(delay=0)
+        manager = await _manager_with_tool(monkeypatch, probe)
+        manager._tool_cache.ttl = 0.01
+
+        await manager.execute_tool("lookup", {"query": "inbox"})
+        await asyncio.sleep(0.02)
+        result = await manager.execute_tool("lookup", {"query": "inbox"})
+
+        assert probe.calls == 2
+        assert result["result"] == "inbox #2"
+
+    async def test_failures_are_not_cached(self, monkeypatch):
+        """Test that a failed call is retried rather than served from the cache"""
+        probe = ConcurrencyProbe(delay=0)
+        manager = await _manager_with_tool(monkeypatch, probe)
+
+        for _ in range(2):
+            result = await manager.execute_tool("lookup", {"wrong": 1})
+            assert not result["success"]
+        assert len(manager._tool_cache) == 0
+
+    async def test_unmemoized_tool_always_runs(self, monkeypatch):
+        """Test that tools outside MEMOIZED_TOOLS are never cached"""
+        probe = ConcurrencyProbe(delay=0)
+        manager = await _manager_with_tool(monkeypatch, probe, name="send")
+
+        for _ in range(2):
+            await manager.execute_tool("send", {"query": "hello"})
+        assert probe.calls == 2
+
+
+class TestCpuBoundTools:
+    """Test that cpu_bound synchronous tools run off the event loop thread"""
+
+    @staticmethod
+    def _thread_tool(name="thread_name"):
+        def thread_name(ctx, args: LookupInput) -> str:
+            return threading.current_thread().name
+
+        return Tool(name=name, function=thread_name, args_schema=LookupInput, cpu_bound=True)
+
+    async def test_runs_in_manager_pool(self):
+        """Test that the manager runs cpu_bound tools in its worker pool and shuts it down in cleanup"""
+        manager = SpartacusAgentManager()
+        manager.tools["thread_name"] = self._thread_tool()
+        await manager._load_tools()
+
+        result = await manager.execute_tool("thread_name", {"query": "x"})
+        pool = manager._blocking_pool
+
+        assert result["success"], result.get("error")
+        assert result["result"].startswith("spartacus-blocking")
+        await manager.cleanup()
+        assert manager._blocking_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(int)
+
+    async def test_runs_off_loop_without_executor(self):
+        """Test that a cpu_bound tool without an executor uses the loop's default one"""
+        tool = self._thread_tool()
+
+        thread = await tool.invoke(Context(), {"query": "x"})
+
+        assert thread != threading.current_thread().name